@@ -1,69 +1,96 @@
 """Example usage of Gmail connector."""
 
 import asyncio
+import logging
+from contextlib import aclosing
+
+# Use the libuv-based event loop when available
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 from dotenv import load_dotenv
 from src.config import load_config
 from src.ingestion.adapters import GmailConnector
 
+logger = logging.getLogger(__name__)
+
 
 async def main():
     """Example of using Gmail connector."""
-    
+
     # Load configuration from environment variables
     load_dotenv()  # Load from .env file if present
     system_config = load_config()
-    
+
     # Get Gmail configuration
     if not system_config.gmail:
-        print("Error: Gmail configuration not found. Set GMAIL_CREDENTIALS_PATH environment variable.")
+        logger.error("Gmail configuration not found. Set GMAIL_CREDENTIALS_PATH environment variable.")
         return
-    
+
     # Create connector using config
     connector = GmailConnector("gmail_source_1", system_config.to_gmail_dict())
-    
+
     try:
         # Connect to Gmail
         await connector.connect()
-        print("Connected to Gmail")
-        
+        logger.info("Connected to Gmail")
+
         # Check health
         is_healthy = await connector.health_check()
-        print(f"Gmail health check: {is_healthy}")
-        
-        # Fetch events (emails)
-        print("\nFetching emails...")
+        logger.info("Gmail health check: %s", is_healthy)
+
+        # Fetch events (emails) in batches to avoid one round-trip per message.
+        # Each batch is bounded by a timeout, and the generator is closed
+        # explicitly so no prefetched work is left dangling after we stop early.
+        logger.info("Fetching emails...")
         count = 0
-        async for event in connector.fetch_events():
-            count += 1
-            print(f"\n--- Event {count} ---")
-            print(f"Event ID: {event.event_id}")
-            print(f"Timestamp: {event.timestamp}")
-            print(f"Subject: {event.raw_payload.get('subject', 'N/A')}")
-            print(f"From: {event.raw_payload.get('from', 'N/A')}")
-            print(f"Snippet: {event.raw_payload.get('snippet', 'N/A')[:100]}...")
-            
-            # Limit to first 5 for example
-            if count >= 5:
-                break
-        
+        gen = connector.fetch_events_batch(batch_size=50).__aiter__()
+        try:
+            while count < 5:  # Limit to first 5 for example
+                try:
+                    events = await asyncio.wait_for(gen.__anext__(), timeout=10)
+                except StopAsyncIteration:
+                    break
+                for event in events:
+                    # A batch can hold more than the cap; stop mid-batch
+                    if count >= 5:
+                        break
+                    count += 1
+                    # Guard the per-event output so the formatting is skipped
+                    # entirely when INFO logging is disabled
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("--- Event %d ---", count)
+                        logger.info("Event ID: %s", event.event_id)
+                        logger.info("Timestamp: %s", event.timestamp)
+                        logger.info("Subject: %s", event.raw_payload.get('subject', 'N/A'))
+                        logger.info("From: %s", event.raw_payload.get('from', 'N/A'))
+                        logger.info("Snippet: %.100s...", event.raw_payload.get('snippet', 'N/A'))
+        finally:
+            await gen.aclose()
+
         # Update query dynamically
-        print("\n\nUpdating query to fetch emails with attachments...")
+        logger.info("Updating query to fetch emails with attachments...")
         connector.set_query("has:attachment is:unread")
-        
-        # Fetch with new query
-        print("Fetching emails with new query...")
-        async for event in connector.fetch_events():
-            print(f"Found email: {event.raw_payload.get('subject', 'N/A')}")
-            break  # Just show first one
-        
+
+        # Fetch with new query; aclosing guarantees the generator is torn
+        # down before disconnect() runs, so no HTTP state is left in flight
+        logger.info("Fetching emails with new query...")
+        async with aclosing(connector.fetch_events()) as events:
+            async for event in events:
+                logger.info("Found email: %s", event.raw_payload.get('subject', 'N/A'))
+                break  # Just show first one
+
     except Exception as e:
-        print(f"Error: {e}")
+        logger.error("Error: %s", e)
     finally:
         # Disconnect
         await connector.disconnect()
-        print("\nDisconnected from Gmail")
+        logger.info("Disconnected from Gmail")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(main())
-
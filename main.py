@@ -1,10 +1,21 @@
 """Main entry point for the system."""
 
 import asyncio
+import logging
+
+# Use the libuv-based event loop when available; both entry points are
+# network-bound, so the faster loop directly improves throughput
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 from dotenv import load_dotenv
 from src.config import load_config
+from src.logging_config import setup_logging
 from src.orchestrator import SystemOrchestrator
-from src.ingestion import GmailConnector
+from src.ingestion import get_factory
 from src.queue import InMemoryEventQueue
 from src.processing import (
     EventProcessingEngine,
@@ -12,13 +23,18 @@ from src.processing import (
     LLMService,
     DataExtractor
 )
-from src.calendar import GoogleCalendarProvider, ICalProvider
-from src.notifications import NotificationEngine, SMSChannel, EmailChannel
+from src.notifications import NotificationEngine
+
+logger = logging.getLogger(__name__)
 
 
 async def main():
     """Initialize and start the system."""
-    
+
+    # Log records are handed off to a listener thread, so hot-path
+    # error handlers never block on terminal I/O
+    setup_logging()
+
     # Load configuration from environment variables
     load_dotenv()  # Load from .env file if present
     config = load_config()
@@ -31,37 +47,15 @@ async def main():
         connector_name = connector_def.get('name', f"{connector_type}_connector")
         source_id = connector_def.get('source_id', connector_name)
         
-        if connector_type == 'gmail':
-            # Convert connector definition to Gmail config dict
-            gmail_config = {
-                "credentials_path": connector_def.get('credentials_path'),
-                "token_path": connector_def.get('token_path'),
-                "query": connector_def.get('query', 'is:unread'),
-                "max_results": connector_def.get('max_results', 100),
-                "processed_label": connector_def.get('processed_label', 'kiddo/processed'),
-                "label_ids": connector_def.get('label_ids'),
-            }
-            connectors.append(GmailConnector(source_id, gmail_config))
-        
-        elif connector_type == 'api':
-            # TODO: Initialize API connector
-            # connectors.append(APIConnector(source_id, connector_def))
-            pass
-        
-        elif connector_type == 'webhook':
-            # TODO: Initialize Webhook connector
-            # connectors.append(WebhookConnector(source_id, connector_def))
-            pass
-        
-        elif connector_type == 'file':
-            # TODO: Initialize File connector
-            # connectors.append(FileConnector(source_id, connector_def))
-            pass
-        
-        elif connector_type == 'database':
-            # TODO: Initialize Database connector
-            # connectors.append(DatabaseConnector(source_id, connector_def))
-            pass
+        factory = get_factory(connector_type)
+        if factory:
+            connectors.append(factory(source_id, connector_def))
+        else:
+            # TODO: api/webhook/file/database connectors not implemented yet
+            logger.warning(
+                "Skipping connector %s: no factory for type '%s'",
+                connector_name, connector_type
+            )
     
     # Add other connectors (can be configured via env or hardcoded for now)
     # connectors.append(APIConnector("api_source_1", {"endpoint": "https://api.example.com"}))
@@ -84,21 +78,40 @@ async def main():
         extractor=extractor
     )
     
-    # Initialize calendar providers
+    # Initialize calendar providers; imports are gated on config presence so
+    # unused provider modules (and their SDKs) are never loaded
     calendar_providers = {}
     if config.google_calendar:
+        from src.calendar import GoogleCalendarProvider
         calendar_providers["google"] = GoogleCalendarProvider(config.to_google_calendar_dict())
     if config.ical:
+        from src.calendar import ICalProvider
         calendar_providers["ical"] = ICalProvider(config.to_ical_dict())
-    
+
     # Initialize notification channels
     notification_channels = {}
     if config.sms:
+        from src.notifications import SMSChannel
         notification_channels["sms"] = SMSChannel(config.to_sms_dict())
     if config.email:
+        from src.notifications import EmailChannel
         notification_channels["email"] = EmailChannel(config.to_email_dict())
     notification_engine = NotificationEngine(channels=notification_channels)
-    
+
+    # Authenticate calendar providers concurrently so cold start pays the
+    # slowest latency once instead of the sum; one failing provider should
+    # not cancel the others
+    if calendar_providers:
+        auth_results = await asyncio.gather(
+            *(provider.authenticate() for provider in calendar_providers.values()),
+            return_exceptions=True
+        )
+        for provider_name, result in zip(calendar_providers, auth_results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    "Authentication failed for %s: %s", provider_name, result
+                )
+
     # Create orchestrator
     orchestrator = SystemOrchestrator(
         connectors=connectors,
@@ -112,7 +125,7 @@ async def main():
     try:
         await orchestrator.start()
     except KeyboardInterrupt:
-        print("Shutting down...")
+        logger.info("Shutting down...")
         await orchestrator.stop()
 
 
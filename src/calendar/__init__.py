@@ -1,8 +1,6 @@
 """Calendar integration layer."""
 
 from .provider import CalendarProvider
-from .google_calendar import GoogleCalendarProvider
-from .ical_provider import ICalProvider
 
 __all__ = [
     "CalendarProvider",
@@ -11,3 +9,13 @@ __all__ = [
 ]
 
 
+def __getattr__(name):
+    # Import provider implementations lazily so deployments without a
+    # given calendar never load its module (or its SDK dependencies).
+    if name == "GoogleCalendarProvider":
+        from .google_calendar import GoogleCalendarProvider
+        return GoogleCalendarProvider
+    if name == "ICalProvider":
+        from .ical_provider import ICalProvider
+        return ICalProvider
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
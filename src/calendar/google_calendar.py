@@ -1,14 +1,28 @@
 """Google Calendar provider implementation."""
 
-from typing import List
-from datetime import datetime
+import os
 import uuid
+from typing import List, Optional
+from datetime import datetime, timedelta
 
 from .provider import CalendarProvider
 from ..models.event import StructuredEvent
 from ..models.calendar import CalendarEvent, SyncStatus
 
 
+_TZ = 'Europe/Warsaw'  # TODO: Make timezone configurable
+_DEFAULT_REMINDER = {'method': 'popup', 'minutes': 15}
+# Shared default reminders block for events without a custom alert;
+# treated as read-only by the API call
+_DEFAULT_REMINDERS = {'useDefault': False, 'overrides': [_DEFAULT_REMINDER]}
+
+
+def _batch_ids(n: int) -> List[str]:
+    """Generate n hex event IDs from one bulk urandom read."""
+    buf = os.urandom(16 * n)
+    return [buf[i * 16:(i + 1) * 16].hex() for i in range(n)]
+
+
 class GoogleCalendarProvider(CalendarProvider):
     """Google Calendar integration."""
     
@@ -25,9 +39,15 @@ class GoogleCalendarProvider(CalendarProvider):
     async def create_event(
         self,
         structured_event: StructuredEvent,
-        calendar_id: str
+        calendar_id: str,
+        _now: Optional[datetime] = None
     ) -> CalendarEvent:
-        """Create event in Google Calendar with customizable alerts."""
+        """
+        Create event in Google Calendar with customizable alerts.
+
+        Batch callers may pass _now so all records of one batch share a
+        single timestamp instead of calling datetime.now() per event.
+        """
         # TODO: Implement Google Calendar event creation
         # Convert StructuredEvent to Google Calendar format
         # Handle timezone conversion
@@ -40,60 +60,52 @@ class GoogleCalendarProvider(CalendarProvider):
             'description': structured_event.description or '',
             'location': structured_event.location or '',
         }
-        
+
         # Set start/end times
-        if structured_event.start_time:
+        start_time = structured_event.start_time
+        end_time = structured_event.end_time
+        if start_time:
             event_body['start'] = {
-                'dateTime': structured_event.start_time.isoformat(),
-                'timeZone': 'Europe/Warsaw',  # TODO: Make timezone configurable
+                'dateTime': start_time.isoformat(),
+                'timeZone': _TZ,
             }
-        if structured_event.end_time:
+        if end_time:
             event_body['end'] = {
-                'dateTime': structured_event.end_time.isoformat(),
-                'timeZone': 'Europe/Warsaw',
+                'dateTime': end_time.isoformat(),
+                'timeZone': _TZ,
             }
-        elif structured_event.start_time:
+        elif start_time:
             # Default to 1 hour if no end time
-            from datetime import timedelta
-            end_time = structured_event.start_time + timedelta(hours=1)
             event_body['end'] = {
-                'dateTime': end_time.isoformat(),
-                'timeZone': 'Europe/Warsaw',
+                'dateTime': (start_time + timedelta(hours=1)).isoformat(),
+                'timeZone': _TZ,
             }
-        
+
         # Add participants/attendees
-        if structured_event.participants:
+        participants = structured_event.participants
+        if participants:
             event_body['attendees'] = [
                 {'email': p} if '@' in p else {'displayName': p}
-                for p in structured_event.participants
+                for p in participants
             ]
-        
+
         # Add reminders/alerts
-        reminders = []
-        if structured_event.alert_before_minutes:
-            # Convert minutes to seconds for Google Calendar
-            reminder_minutes = structured_event.alert_before_minutes
-            reminders.append({
+        reminder_minutes = structured_event.alert_before_minutes
+        if reminder_minutes:
+            reminders = [{
                 'method': 'popup',  # or 'email'
                 'minutes': reminder_minutes
-            })
+            }]
             # Add default reminder as well (15 minutes)
             if reminder_minutes != 15:
-                reminders.append({
-                    'method': 'popup',
-                    'minutes': 15
-                })
+                reminders.append(_DEFAULT_REMINDER)
+            event_body['reminders'] = {
+                'useDefault': False,
+                'overrides': reminders
+            }
         else:
-            # Default reminder
-            reminders.append({
-                'method': 'popup',
-                'minutes': 15
-            })
-        
-        event_body['reminders'] = {
-            'useDefault': False,
-            'overrides': reminders
-        }
+            # Default reminder (shared, read-only)
+            event_body['reminders'] = _DEFAULT_REMINDERS
         
         # TODO: Actually call Google Calendar API
         # created_event = self.service.events().insert(
@@ -104,14 +116,48 @@ class GoogleCalendarProvider(CalendarProvider):
         calendar_event = CalendarEvent(
             calendar_provider=self.provider_name,
             calendar_id=calendar_id,
-            provider_event_id=str(uuid.uuid4()),  # From API response
+            provider_event_id=uuid.uuid4().hex,  # From API response
             structured_event_id=structured_event.event_id,
             sync_status=SyncStatus.SYNCED,
-            last_sync_timestamp=datetime.now()
+            last_sync_timestamp=_now or datetime.now()
         )
-        
+
         return calendar_event
     
+    async def create_events(
+        self,
+        pairs: List[tuple]
+    ) -> List[CalendarEvent]:
+        """
+        Create multiple events in Google Calendar with one batched request.
+
+        Google's batch endpoint accepts up to 50 inserts per HTTP call, so
+        syncing a burst of events costs one round-trip instead of one per
+        event.
+        """
+        # TODO: Submit via BatchHttpRequest once the API client is initialized:
+        # batch = self.service.new_batch_http_request(callback=collect_result)
+        # for structured_event, calendar_id in pairs:
+        #     batch.add(self.service.events().insert(
+        #         calendarId=calendar_id,
+        #         body=event_body  # built as in create_event
+        #     ))
+        # await asyncio.to_thread(batch.execute)
+
+        now = datetime.now()
+        event_ids = _batch_ids(len(pairs))
+        return [
+            CalendarEvent(
+                calendar_provider=self.provider_name,
+                calendar_id=calendar_id,
+                provider_event_id=event_id,  # From API response
+                structured_event_id=structured_event.event_id,
+                sync_status=SyncStatus.SYNCED,
+                last_sync_timestamp=now
+            )
+            for (structured_event, calendar_id), event_id in zip(pairs, event_ids)
+        ]
+
     async def update_event(
         self,
         calendar_event: CalendarEvent,
@@ -1,6 +1,6 @@
 """iCal provider implementation."""
 
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 import uuid
 
@@ -25,22 +25,28 @@ class ICalProvider(CalendarProvider):
     async def create_event(
         self,
         structured_event: StructuredEvent,
-        calendar_id: str
+        calendar_id: str,
+        _now: Optional[datetime] = None
     ) -> CalendarEvent:
-        """Create event in iCal calendar."""
+        """
+        Create event in iCal calendar.
+
+        Batch callers may pass _now so all records of one batch share a
+        single timestamp instead of calling datetime.now() per event.
+        """
         # TODO: Implement iCal event creation
         # Convert StructuredEvent to iCal format
         # Handle timezone conversion
-        
+
         calendar_event = CalendarEvent(
             calendar_provider=self.provider_name,
             calendar_id=calendar_id,
-            provider_event_id=str(uuid.uuid4()),
+            provider_event_id=uuid.uuid4().hex,
             structured_event_id=structured_event.event_id,
             sync_status=SyncStatus.SYNCED,
-            last_sync_timestamp=datetime.now()
+            last_sync_timestamp=_now or datetime.now()
         )
-        
+
         return calendar_event
     
     async def update_event(
@@ -1,7 +1,8 @@
 """Calendar provider interface."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from ..models.event import StructuredEvent
 from ..models.calendar import CalendarEvent, SyncStatus
@@ -29,6 +30,21 @@ class CalendarProvider(ABC):
         """Create event in calendar."""
         pass
     
+    async def create_events(
+        self,
+        pairs: List[Tuple[StructuredEvent, str]]
+    ) -> List[CalendarEvent]:
+        """
+        Create multiple events in one go.
+
+        Providers with a batch API should override this; the default
+        implementation runs the individual create_event calls concurrently.
+        """
+        return list(await asyncio.gather(
+            *(self.create_event(structured_event, calendar_id)
+              for structured_event, calendar_id in pairs)
+        ))
+
     @abstractmethod
     async def update_event(
         self,
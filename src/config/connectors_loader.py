@@ -1,10 +1,39 @@
 """Load connectors from YAML configuration file."""
 
+import logging
 import os
+import sys
 import yaml
 from pathlib import Path
 from typing import List, Dict
 
+logger = logging.getLogger(__name__)
+
+# Prefer the libyaml C parser when PyYAML was built with it; it is an
+# order of magnitude faster than the pure-Python SafeLoader.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Parsed connector lists keyed by (resolved path, mtime_ns) so repeated
+# config loads within a process skip the disk read and YAML parse.
+_cache: Dict[tuple, List[Dict]] = {}
+
+# (yaml_key, type_name) pairs, precomputed so the per-load loop does no
+# string manipulation. Interned so downstream type comparisons hit the
+# pointer-equality fast path.
+_CONNECTOR_SECTIONS: tuple = tuple(
+    (sys.intern(key), sys.intern(key.removesuffix('_connectors')))
+    for key in (
+        'gmail_connectors',
+        'api_connectors',
+        'webhook_connectors',
+        'file_connectors',
+        'database_connectors',
+    )
+)
+
 
 def load_connectors_from_file(connectors_file: str = None) -> List[Dict]:
     """Load all connectors from connectors.yaml file."""
@@ -15,30 +44,32 @@ def load_connectors_from_file(connectors_file: str = None) -> List[Dict]:
     
     if not connectors_path.exists():
         return []
-    
+
     try:
+        cache_key = (str(connectors_path.resolve()), connectors_path.stat().st_mtime_ns)
+        cached = _cache.get(cache_key)
+        if cached is not None:
+            # Shallow copy so callers can append/remove without poisoning the cache
+            return list(cached)
+
         with open(connectors_path, 'r', encoding='utf-8') as f:
-            connectors_data = yaml.safe_load(f) or {}
+            connectors_data = yaml.load(f, Loader=_YamlLoader) or {}
         
         all_connectors = []
-        
-        # Load all connector types
-        connector_types = [
-            'gmail_connectors',
-            'api_connectors',
-            'webhook_connectors',
-            'file_connectors',
-            'database_connectors'
-        ]
-        
-        for connector_type in connector_types:
-            type_name = connector_type.replace('_connectors', '')
-            for connector_def in connectors_data.get(connector_type, []):
+
+        # Load all connector types, skipping missing or empty sections
+        for yaml_key, type_name in _CONNECTOR_SECTIONS:
+            section = connectors_data.get(yaml_key)
+            if not section:
+                continue
+            for connector_def in section:
                 connector_def['type'] = type_name
-                all_connectors.append(connector_def)
-        
-        return all_connectors
+            all_connectors.extend(section)
+
+        _cache[cache_key] = all_connectors
+        return list(all_connectors)
     except Exception as e:
-        print(f"Warning: Could not load connectors config from {connectors_path}: {e}")
+        # Lazy %-style args: the message is only formatted when emitted
+        logger.warning("Could not load connectors config from %s: %s", connectors_path, e)
         return []
 
@@ -1,7 +1,7 @@
 """Load configuration from environment variables."""
 
 import os
-from typing import Optional
+from typing import Dict, Mapping, Optional
 
 from .models import (
     LLMConfig,
@@ -12,58 +12,78 @@ from .models import (
 )
 
 
-def load_llm_config() -> Optional[LLMConfig]:
+def snapshot_env() -> Dict[str, str]:
+    """
+    Snapshot os.environ into a plain dict.
+
+    Plain dict lookups are cheaper than going through the environ proxy,
+    so callers doing several lookups should take one snapshot and pass it
+    to the load_*_config functions.
+    """
+    return dict(os.environ)
+
+
+def load_llm_config(env: Optional[Mapping[str, str]] = None) -> Optional[LLMConfig]:
     """Load LLM configuration from environment."""
-    if not os.getenv("LLM_API_KEY"):
+    if env is None:
+        env = snapshot_env()
+    if not env.get("LLM_API_KEY"):
         return None
-    
+
     return LLMConfig(
-        api_key=os.getenv("LLM_API_KEY"),
-        model=os.getenv("LLM_MODEL", "gpt-4"),
-        provider=os.getenv("LLM_PROVIDER", "openai"),
-        prompts_dir=os.getenv("LLM_PROMPTS_DIR"),
+        api_key=env.get("LLM_API_KEY"),
+        model=env.get("LLM_MODEL", "gpt-4"),
+        provider=env.get("LLM_PROVIDER", "openai"),
+        prompts_dir=env.get("LLM_PROMPTS_DIR"),
     )
 
 
-def load_google_calendar_config() -> Optional[GoogleCalendarConfig]:
+def load_google_calendar_config(env: Optional[Mapping[str, str]] = None) -> Optional[GoogleCalendarConfig]:
     """Load Google Calendar configuration from environment."""
-    if not os.getenv("GOOGLE_CALENDAR_CREDENTIALS_PATH"):
+    if env is None:
+        env = snapshot_env()
+    if not env.get("GOOGLE_CALENDAR_CREDENTIALS_PATH"):
         return None
-    
+
     return GoogleCalendarConfig(
-        credentials_path=os.getenv("GOOGLE_CALENDAR_CREDENTIALS_PATH"),
+        credentials_path=env.get("GOOGLE_CALENDAR_CREDENTIALS_PATH"),
     )
 
 
-def load_ical_config() -> Optional[ICalConfig]:
+def load_ical_config(env: Optional[Mapping[str, str]] = None) -> Optional[ICalConfig]:
     """Load iCal configuration from environment."""
-    if not os.getenv("ICAL_URL"):
+    if env is None:
+        env = snapshot_env()
+    if not env.get("ICAL_URL"):
         return None
-    
-    return ICalConfig(url=os.getenv("ICAL_URL"))
 
+    return ICalConfig(url=env.get("ICAL_URL"))
 
-def load_sms_config() -> Optional[SMSConfig]:
+
+def load_sms_config(env: Optional[Mapping[str, str]] = None) -> Optional[SMSConfig]:
     """Load SMS configuration from environment."""
-    if not os.getenv("SMS_API_KEY"):
+    if env is None:
+        env = snapshot_env()
+    if not env.get("SMS_API_KEY"):
         return None
-    
+
     return SMSConfig(
-        api_key=os.getenv("SMS_API_KEY"),
-        provider=os.getenv("SMS_PROVIDER", "twilio"),
+        api_key=env.get("SMS_API_KEY"),
+        provider=env.get("SMS_PROVIDER", "twilio"),
     )
 
 
-def load_email_config() -> Optional[EmailConfig]:
+def load_email_config(env: Optional[Mapping[str, str]] = None) -> Optional[EmailConfig]:
     """Load Email configuration from environment."""
-    if not os.getenv("EMAIL_SMTP_SERVER"):
+    if env is None:
+        env = snapshot_env()
+    if not env.get("EMAIL_SMTP_SERVER"):
         return None
-    
+
     return EmailConfig(
-        smtp_server=os.getenv("EMAIL_SMTP_SERVER"),
-        smtp_port=int(os.getenv("EMAIL_SMTP_PORT", "587")),
-        username=os.getenv("EMAIL_USERNAME"),
-        password=os.getenv("EMAIL_PASSWORD"),
-        use_tls=os.getenv("EMAIL_USE_TLS", "true").lower() == "true",
+        smtp_server=env.get("EMAIL_SMTP_SERVER"),
+        smtp_port=int(env.get("EMAIL_SMTP_PORT", "587")),
+        username=env.get("EMAIL_USERNAME"),
+        password=env.get("EMAIL_PASSWORD"),
+        use_tls=env.get("EMAIL_USE_TLS", "true").lower() == "true",
     )
-
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class GmailConfig:
     """Gmail connector configuration."""
     credentials_path: str
@@ -15,7 +15,7 @@ class GmailConfig:
     processed_label: str = "kiddo/processed"
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMConfig:
     """LLM service configuration."""
     api_key: str
@@ -24,26 +24,26 @@ class LLMConfig:
     prompts_dir: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GoogleCalendarConfig:
     """Google Calendar configuration."""
     credentials_path: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ICalConfig:
     """iCal provider configuration."""
     url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SMSConfig:
     """SMS channel configuration."""
     api_key: str
     provider: str = "twilio"
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailConfig:
     """Email channel configuration."""
     smtp_server: str
@@ -1,7 +1,8 @@
 """Main system configuration."""
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence
 
 from .models import GmailConfig
 from .connectors_loader import load_connectors_from_file
@@ -10,42 +11,80 @@ from .env_loader import (
     load_google_calendar_config,
     load_ical_config,
     load_sms_config,
-    load_email_config
+    load_email_config,
+    snapshot_env
 )
 
 
+# Shared read-only empty mapping returned when a sub-config is absent
+_EMPTY: Mapping = MappingProxyType({})
+
+
 @dataclass
 class SystemConfig:
     """Main system configuration."""
-    connectors: List[Dict] = field(default_factory=list)
+    _connectors: Sequence[Dict] = field(default_factory=tuple)
     llm: Optional[object] = None
     google_calendar: Optional[object] = None
     ical: Optional[object] = None
     sms: Optional[object] = None
     email: Optional[object] = None
-    
+    # Cache for gmail_connectors, invalidated when connectors is reassigned
+    _gmail_connectors_cache: Optional[Dict[int, GmailConfig]] = field(
+        default=None, init=False, repr=False
+    )
+    _connectors_version: int = field(default=0, init=False, repr=False)
+    _gmail_cache_version: int = field(default=-1, init=False, repr=False)
+    # Lazily built read-only dict views handed to component constructors
+    _gmail_dicts: Dict[int, Mapping] = field(default_factory=dict, init=False, repr=False)
+    _llm_dict: Optional[Mapping] = field(default=None, init=False, repr=False)
+    _google_calendar_dict: Optional[Mapping] = field(default=None, init=False, repr=False)
+    _ical_dict: Optional[Mapping] = field(default=None, init=False, repr=False)
+    _sms_dict: Optional[Mapping] = field(default=None, init=False, repr=False)
+    _email_dict: Optional[Mapping] = field(default=None, init=False, repr=False)
+
+    @property
+    def connectors(self) -> Sequence[Dict]:
+        """Connector configurations loaded from connectors.yaml."""
+        return self._connectors
+
+    @connectors.setter
+    def connectors(self, value: Sequence[Dict]) -> None:
+        self._connectors = value
+        self._connectors_version += 1
+        self._gmail_connectors_cache = None
+        self._gmail_dicts.clear()
+
     @property
     def gmail_connectors(self) -> Dict[int, GmailConfig]:
         """Get Gmail connectors as dict for backward compatibility."""
-        gmail_dict = {}
-        for idx, conn in enumerate(self.connectors, start=1):
-            if conn.get('type') == 'gmail':
-                gmail_dict[idx] = GmailConfig(
-                    credentials_path=conn.get('credentials_path', ''),
-                    token_path=conn.get('token_path'),
-                    query=conn.get('query', 'is:unread'),
-                    max_results=int(conn.get('max_results', 100)),
-                    processed_label=conn.get('processed_label', f"kiddo/processed_{idx}"),
-                    label_ids=conn.get('label_ids'),
-                )
+        if (self._gmail_connectors_cache is not None
+                and self._gmail_cache_version == self._connectors_version):
+            return self._gmail_connectors_cache
+
+        gmail_dict = {
+            idx: GmailConfig(
+                credentials_path=conn.get('credentials_path', ''),
+                token_path=conn.get('token_path'),
+                query=conn.get('query', 'is:unread'),
+                max_results=int(conn.get('max_results', 100)),
+                processed_label=conn.get('processed_label', f"kiddo/processed_{idx}"),
+                label_ids=conn.get('label_ids'),
+            )
+            for idx, conn in enumerate(self._connectors, start=1)
+            if conn.get('type') == 'gmail'
+        }
+
+        self._gmail_connectors_cache = gmail_dict
+        self._gmail_cache_version = self._connectors_version
         return gmail_dict
-    
+
     @property
     def gmail(self) -> Optional[GmailConfig]:
         """Backward compatibility: return first Gmail config if exists."""
         gmail_conns = self.gmail_connectors
         if gmail_conns:
-            return list(gmail_conns.values())[0]
+            return next(iter(gmail_conns.values()))
         return None
     
     @classmethod
@@ -53,79 +92,104 @@ class SystemConfig:
         """Load configuration from environment variables and files."""
         config = cls()
         
-        # Load connectors from YAML file
-        config.connectors = load_connectors_from_file()
+        # Load connectors from YAML file; a tuple snapshot is immutable, so
+        # iteration can never race a config reload (reloads swap atomically
+        # via the connectors setter)
+        config.connectors = tuple(load_connectors_from_file())
         
-        # Load other configurations from environment
-        config.llm = load_llm_config()
-        config.google_calendar = load_google_calendar_config()
-        config.ical = load_ical_config()
-        config.sms = load_sms_config()
-        config.email = load_email_config()
+        # Load other configurations from a single environment snapshot
+        env = snapshot_env()
+        config.llm = load_llm_config(env)
+        config.google_calendar = load_google_calendar_config(env)
+        config.ical = load_ical_config(env)
+        config.sms = load_sms_config(env)
+        config.email = load_email_config(env)
         
         return config
     
-    def to_gmail_dict(self, instance_num: int = 1) -> Dict:
+    def to_gmail_dict(self, instance_num: int = 1) -> Mapping:
         """Convert Gmail config to dictionary for connector."""
+        cached = self._gmail_dicts.get(instance_num)
+        if cached is not None:
+            return cached
         gmail_config = self.gmail_connectors.get(instance_num)
         if not gmail_config:
-            return {}
-        return {
+            return _EMPTY
+        result = MappingProxyType({
             "credentials_path": gmail_config.credentials_path,
             "token_path": gmail_config.token_path,
             "query": gmail_config.query,
             "max_results": gmail_config.max_results,
             "label_ids": gmail_config.label_ids,
             "processed_label": gmail_config.processed_label,
-        }
+        })
+        self._gmail_dicts[instance_num] = result
+        return result
     
-    def get_connectors(self) -> List[Dict]:
-        """Get all connector configurations."""
-        return self.connectors.copy()
+    def get_connectors(self) -> Sequence[Dict]:
+        """
+        Get all connector configurations.
+
+        Returns the internal tuple snapshot directly; it is immutable, so
+        there is nothing for callers to corrupt and no copy to pay for.
+        """
+        return self.connectors
     
     def get_gmail_configs(self) -> Dict[int, GmailConfig]:
         """Get all Gmail connector configurations (backward compatibility)."""
         return self.gmail_connectors
     
     # Helper methods for converting configs to dicts
-    def to_llm_dict(self) -> Dict:
+    def to_llm_dict(self) -> Mapping:
         """Convert LLM config to dictionary for service."""
         if not self.llm:
-            return {}
-        result = {"api_key": self.llm.api_key, "model": self.llm.model}
-        if self.llm.prompts_dir:
-            result["prompts_dir"] = self.llm.prompts_dir
-        return result
-    
-    def to_google_calendar_dict(self) -> Dict:
+            return _EMPTY
+        if self._llm_dict is None:
+            result = {"api_key": self.llm.api_key, "model": self.llm.model}
+            if self.llm.prompts_dir:
+                result["prompts_dir"] = self.llm.prompts_dir
+            self._llm_dict = MappingProxyType(result)
+        return self._llm_dict
+
+    def to_google_calendar_dict(self) -> Mapping:
         """Convert Google Calendar config to dictionary."""
         if not self.google_calendar:
-            return {}
-        return {"credentials": self.google_calendar.credentials_path}
-    
-    def to_ical_dict(self) -> Dict:
+            return _EMPTY
+        if self._google_calendar_dict is None:
+            self._google_calendar_dict = MappingProxyType(
+                {"credentials": self.google_calendar.credentials_path}
+            )
+        return self._google_calendar_dict
+
+    def to_ical_dict(self) -> Mapping:
         """Convert iCal config to dictionary."""
         if not self.ical:
-            return {}
-        return {"url": self.ical.url}
-    
-    def to_sms_dict(self) -> Dict:
+            return _EMPTY
+        if self._ical_dict is None:
+            self._ical_dict = MappingProxyType({"url": self.ical.url})
+        return self._ical_dict
+
+    def to_sms_dict(self) -> Mapping:
         """Convert SMS config to dictionary."""
         if not self.sms:
-            return {}
-        return {"api_key": self.sms.api_key}
-    
-    def to_email_dict(self) -> Dict:
+            return _EMPTY
+        if self._sms_dict is None:
+            self._sms_dict = MappingProxyType({"api_key": self.sms.api_key})
+        return self._sms_dict
+
+    def to_email_dict(self) -> Mapping:
         """Convert Email config to dictionary."""
         if not self.email:
-            return {}
-        return {
-            "smtp_server": self.email.smtp_server,
-            "smtp_port": self.email.smtp_port,
-            "username": self.email.username,
-            "password": self.email.password,
-            "use_tls": self.email.use_tls,
-        }
+            return _EMPTY
+        if self._email_dict is None:
+            self._email_dict = MappingProxyType({
+                "smtp_server": self.email.smtp_server,
+                "smtp_port": self.email.smtp_port,
+                "username": self.email.username,
+                "password": self.email.password,
+                "use_tls": self.email.use_tls,
+            })
+        return self._email_dict
 
 
 # Global config instance
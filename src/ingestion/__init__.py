@@ -1,10 +1,20 @@
 """Event ingestion layer."""
 
 from .connector import SourceConnector
-from .adapters import GmailConnector
+from .registry import get_factory, register
 
 __all__ = [
     "SourceConnector",
     "GmailConnector",
+    "get_factory",
+    "register",
 ]
 
+
+def __getattr__(name):
+    # Import connector implementations lazily so startup only loads the
+    # modules (and their optional dependencies) that are actually used.
+    if name == "GmailConnector":
+        from .adapters import GmailConnector
+        return GmailConnector
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
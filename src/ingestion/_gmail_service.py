@@ -0,0 +1,66 @@
+"""Process-level Gmail service cache.
+
+Building a Gmail service creates a fresh HTTP client with its own TCP
+connection pool, so every connector that authenticates separately pays
+the full TCP/TLS handshake cost again. Memoizing the service per
+(credentials_path, token_path) pair lets multi-connector deployments
+share one keep-alive pool and refresh OAuth credentials once per
+process.
+"""
+
+import functools
+import os
+
+# Need modify scope to add/remove labels
+# Note: gmail.modify allows: read, compose, send, and manage labels
+SCOPES = ['https://www.googleapis.com/auth/gmail.modify']
+
+
+def _save_token(creds, token_path: str) -> None:
+    """Atomically persist credentials so a crash mid-write cannot corrupt the token file."""
+    tmp_path = token_path + ".tmp"
+    with open(tmp_path, 'w') as token:
+        token.write(creds.to_json())
+    os.replace(tmp_path, token_path)
+
+
+@functools.lru_cache(maxsize=16)
+def get_service(credentials_path, token_path):
+    """
+    Return a Gmail API service for the given credential files.
+
+    Results are cached, so connectors sharing the same credentials reuse
+    a single authenticated service and its underlying connection pool.
+    """
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    from google.auth.transport.requests import Request
+    from googleapiclient.discovery import build
+
+    creds = None
+
+    # Load existing token from JSON file
+    if token_path and os.path.exists(token_path):
+        creds = Credentials.from_authorized_user_file(token_path, SCOPES)
+
+    # If there are no (valid) credentials available, let the user log in
+    if not creds or not creds.valid:
+        if creds and creds.expired and creds.refresh_token:
+            creds.refresh(Request())
+        else:
+            if not credentials_path:
+                raise ValueError("credentials_path is required in config")
+            if not os.path.exists(credentials_path):
+                raise FileNotFoundError(
+                    f"Credentials file not found: {credentials_path}"
+                )
+            flow = InstalledAppFlow.from_client_secrets_file(
+                credentials_path, SCOPES
+            )
+            creds = flow.run_local_server(port=0)
+
+        # Save credentials for next run as JSON
+        if token_path:
+            _save_token(creds, token_path)
+
+    return build('gmail', 'v1', credentials=creds)
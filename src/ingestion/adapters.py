@@ -1,19 +1,50 @@
 """Source connector implementations."""
 
-import base64
+import asyncio
+import binascii
+import concurrent.futures
 import json
+import logging
 import os
+import random
 from typing import AsyncIterator
-from datetime import datetime
+from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 
 from .connector import SourceConnector
+from .registry import register
+from ._gmail_service import get_service
 from ..models.event import RawEvent
 
+logger = logging.getLogger(__name__)
+
+# URL-safe alphabet -> standard alphabet; translating bytes in place of
+# base64.urlsafe_b64decode skips that wrapper's extra full-size copy
+_B64_TRANS = bytes.maketrans(b'-_', b'+/')
+
+# Parse Gmail API responses with orjson when both it and the client
+# library are installed; format='full' payloads are large enough that the
+# C parser is a measurable CPU win. Only the client's view of the json
+# module is swapped (dumps stays stdlib, orjson's returns bytes).
+try:
+    import orjson
+    import googleapiclient.http
+    import googleapiclient.model
+    import types
+
+    _fast_json = types.SimpleNamespace(loads=orjson.loads, dumps=json.dumps)
+    googleapiclient.http.json = _fast_json
+    googleapiclient.model.json = _fast_json
+except ImportError:
+    pass
+
 
 class GmailConnector(SourceConnector):
     """Gmail event source connector with query filtering."""
-    
+
+    # Gmail's batch endpoint accepts at most 100 sub-requests per call
+    _BATCH_GET_SIZE = 100
+
     def __init__(self, source_id: str, config: dict):
         """
         Initialize Gmail connector.
@@ -24,60 +55,57 @@ class GmailConnector(SourceConnector):
         - query: Gmail search query string (e.g., "is:unread", "from:example@email.com")
         - max_results: Maximum messages per fetch (default: 100)
         - label_ids: List of label IDs to search (optional)
+        - fetch_body: Whether to download message bodies (default: True).
+          Set False for header-only consumers; metadata responses are
+          10-100x smaller than full MIME trees.
+        - parse_date_header: Timestamp events from the RFC 2822 Date
+          header instead of the server-side internalDate (default: False)
+        - max_concurrent: Cap on in-flight Gmail API calls (default: 10)
+        - max_retries: Retries with exponential backoff on 429/500/503
+          responses (default: 5)
         """
         super().__init__(source_id, config)
         self.service = None
         self.query = config.get("query", "")
         self.max_results = config.get("max_results", 100)
         self.label_ids = config.get("label_ids")
+        self.fetch_body = config.get("fetch_body", True)
+        self.parse_date_header = config.get("parse_date_header", False)
         self.processed_label_name = config.get("processed_label", "kiddo/processed")
         self._processed_label_id = None  # Cache the label ID
+        self._label_index = {}  # {label_name: label_id} from the last labels.list
         self._credentials_path = config.get("credentials_path")
         self._token_path = config.get("token_path")
+        # Persisted {label_name: label_id} map so warm reconnects skip the
+        # labels.list round-trip entirely
+        self._label_cache_path = config.get("label_cache_path") or (
+            self._token_path + ".labels" if self._token_path else None
+        )
+        # Fetch cursor: with a stored historyId, steady-state fetches use
+        # users.history.list and only pay for messages added since the
+        # last run instead of re-listing the whole query
+        self._cursor_path = config.get("cursor_path") or (
+            self._token_path + ".cursor" if self._token_path else None
+        )
+        self._last_history_id = self._load_cursor()
+        # googleapiclient requests are blocking; run them here so the event
+        # loop stays free for other connectors and channels
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=config.get("max_workers", 10)
+        )
+        # Gmail enforces a per-user concurrent-request quota; cap in-flight
+        # API calls so parallel batches back-pressure instead of hitting 429s
+        self._api_sem = asyncio.Semaphore(config.get("max_concurrent", 10))
+        self._max_retries = config.get("max_retries", 5)
     
     async def connect(self) -> None:
         """Establish connection to Gmail API."""
         try:
-            from google.oauth2.credentials import Credentials
-            from google_auth_oauthlib.flow import InstalledAppFlow
-            from google.auth.transport.requests import Request
-            from googleapiclient.discovery import build
-            
-            # Need modify scope to add/remove labels
-            # Note: gmail.modify allows: read, compose, send, and manage labels
-            # For deletion, full gmail scope may be needed: https://mail.google.com/
-            # But for this connector, label management is sufficient (we don't delete emails)
-            SCOPES = ['https://www.googleapis.com/auth/gmail.modify']
-            creds = None
-            
-            # Load existing token from JSON file
-            if self._token_path and os.path.exists(self._token_path):
-                creds = Credentials.from_authorized_user_file(self._token_path, SCOPES)
-            
-            # If there are no (valid) credentials available, let the user log in
-            if not creds or not creds.valid:
-                if creds and creds.expired and creds.refresh_token:
-                    creds.refresh(Request())
-                else:
-                    if not self._credentials_path:
-                        raise ValueError("credentials_path is required in config")
-                    if not os.path.exists(self._credentials_path):
-                        raise FileNotFoundError(
-                            f"Credentials file not found: {self._credentials_path}"
-                        )
-                    flow = InstalledAppFlow.from_client_secrets_file(
-                        self._credentials_path, SCOPES
-                    )
-                    creds = flow.run_local_server(port=0)
-                
-                # Save credentials for next run as JSON
-                if self._token_path:
-                    with open(self._token_path, 'w') as token:
-                        token.write(creds.to_json())
-            
-            # Build Gmail service
-            self.service = build('gmail', 'v1', credentials=creds)
-            
+            # The service is cached per (credentials_path, token_path), so
+            # connectors on the same account share one authenticated HTTP
+            # pool instead of re-running the TLS and OAuth handshakes
+            self.service = get_service(self._credentials_path, self._token_path)
+
             # Ensure processed label exists
             await self._ensure_processed_label()
             
@@ -93,77 +121,361 @@ class GmailConnector(SourceConnector):
     
     async def disconnect(self) -> None:
         """Close connection to Gmail API."""
-        if self.service:
-            self.service.close()
-            self.service = None
+        # The service is shared via the process-level cache, so just drop
+        # our reference instead of closing the pool other connectors use
+        self.service = None
     
+    # Sentinel marking the end of the paginated ID stream
+    _LIST_DONE = object()
+
     async def fetch_events(self) -> AsyncIterator[RawEvent]:
         """
         Fetch emails from Gmail matching the query.
-        
+
         Yields RawEvent for each email message.
         Supports incremental fetching (only new messages).
+
+        Pagination and message fetching are pipelined: a producer task
+        streams message IDs from list() pages into a queue while the
+        consumer issues batched get()s, so the next page is listed while
+        the current batch downloads.
         """
         if not self.service:
             raise RuntimeError("Not connected to Gmail. Call connect() first.")
-        
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2 * self._BATCH_GET_SIZE)
+        # Mailbox historyId observed during this fetch; becomes the next cursor
+        new_history_id = None
+
+        async def _list_pages():
+            """Stream up to max_results message IDs into the queue."""
+            page_token = None
+            remaining = self.max_results
+            while remaining > 0:
+                query_params = {
+                    'q': self._build_query(),
+                    'maxResults': min(remaining, self.max_results),
+                }
+                if self.label_ids:
+                    query_params['labelIds'] = self.label_ids
+                if page_token:
+                    query_params['pageToken'] = page_token
+
+                results = await self._execute(self.service.users().messages().list(
+                    userId='me',
+                    **query_params
+                ))
+
+                page = results.get('messages', [])
+                for message_item in page[:remaining]:
+                    await queue.put(message_item)
+                remaining -= len(page)
+
+                page_token = results.get('nextPageToken')
+                if not page_token:
+                    break
+
+        async def _list_history():
+            """Stream message IDs added since the stored history cursor."""
+            nonlocal new_history_id
+            seen = set()
+            page_token = None
+            while True:
+                history_params = {'startHistoryId': self._last_history_id,
+                                  'historyTypes': ['messageAdded']}
+                if self.label_ids:
+                    history_params['labelId'] = self.label_ids[0]
+                if page_token:
+                    history_params['pageToken'] = page_token
+
+                results = await self._execute(self.service.users().history().list(
+                    userId='me',
+                    **history_params
+                ))
+
+                new_history_id = results.get('historyId', new_history_id)
+                for record in results.get('history', ()):
+                    for added in record.get('messagesAdded', ()):
+                        message_item = added.get('message')
+                        # History can report the same message more than once
+                        if message_item and message_item['id'] not in seen:
+                            seen.add(message_item['id'])
+                            await queue.put(message_item)
+
+                page_token = results.get('nextPageToken')
+                if not page_token:
+                    break
+
+        async def _produce():
+            """Prefer the incremental history path, falling back to a full list."""
+            try:
+                if self._last_history_id:
+                    try:
+                        await _list_history()
+                        return
+                    except Exception as e:
+                        # 404 means the cursor fell outside Gmail's history
+                        # retention window (~7 days); re-list from scratch
+                        if getattr(getattr(e, 'resp', None), 'status', None) != 404:
+                            raise
+                await _list_pages()
+            finally:
+                await queue.put(self._LIST_DONE)
+
+        producer = asyncio.ensure_future(_produce())
+
+        try:
+            done = False
+            while not done:
+                # Accumulate a full batch; a short timeout flushes trailing
+                # partial batches without waiting for slow pages
+                chunk = []
+                while len(chunk) < self._BATCH_GET_SIZE:
+                    if chunk:
+                        try:
+                            item = await asyncio.wait_for(queue.get(), timeout=0.05)
+                        except asyncio.TimeoutError:
+                            break
+                    else:
+                        item = await queue.get()
+                    if item is self._LIST_DONE:
+                        done = True
+                        break
+                    chunk.append(item)
+
+                if not chunk:
+                    break
+
+                for message in await self._batch_get(chunk):
+                    # Skip already processed messages (has kiddo/processed
+                    # label); the label IDs are already in the get() response,
+                    # so no extra round-trip is needed
+                    if (self._processed_label_id
+                            and self._processed_label_id in message.get('labelIds', ())):
+                        continue
+
+                    yield await self._message_to_event(message)
+
+            # Surface list() failures that ended the stream early
+            if producer.done() and producer.exception():
+                raise producer.exception()
+
+            # Advance the cursor only after a clean full pass so a failed
+            # fetch is retried from the same point next time
+            if new_history_id is None:
+                profile = await self._execute(self.service.users().getProfile(userId='me'))
+                new_history_id = profile.get('historyId')
+            if new_history_id:
+                self._last_history_id = new_history_id
+                self._save_cursor(new_history_id)
+
+        except Exception as e:
+            raise RuntimeError(f"Error fetching Gmail events: {e}")
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+    # HTTP statuses worth retrying: per-user rate limit and transient
+    # server errors
+    _RETRYABLE_STATUSES = (429, 500, 503)
+
+    async def _execute(self, request):
+        """
+        Run a blocking googleapiclient request off the event loop.
+
+        Concurrency is bounded by the per-connector semaphore so parallel
+        batches stay under Gmail's per-user concurrent-request quota, and
+        retryable statuses back off exponentially instead of failing the
+        fetch outright.
+        """
+        loop = asyncio.get_running_loop()
+        for attempt in range(self._max_retries + 1):
+            async with self._api_sem:
+                try:
+                    return await loop.run_in_executor(self._executor, request.execute)
+                except Exception as e:
+                    status = getattr(getattr(e, 'resp', None), 'status', None)
+                    if (status not in self._RETRYABLE_STATUSES
+                            or attempt == self._max_retries):
+                        raise
+            # Sleep outside the semaphore so a backing-off call doesn't
+            # hold a concurrency slot
+            delay = 2 ** attempt + random.random()
+            logger.warning(
+                "Gmail API returned %s, retrying in %.1fs (attempt %d/%d)",
+                status, delay, attempt + 1, self._max_retries
+            )
+            await asyncio.sleep(delay)
+
+    def _build_query(self) -> str:
+        """
+        Build the effective list() query.
+
+        Appends -label:<processed_label> so Gmail's index filters already
+        processed messages server-side; set_query callers never need to
+        include the suffix themselves.
+        """
+        label = self.processed_label_name
+        if not label:
+            return self.query
+        # Gmail query syntax needs quoting when the label contains whitespace
+        if any(ch.isspace() for ch in label):
+            label = f'"{label}"'
+        return f"{self.query} -label:{label}".strip()
+
+    async def _batch_get(self, message_items: list) -> list:
+        """
+        Fetch full messages for up to 100 list results in one HTTP call.
+
+        Uses the Gmail batch endpoint to multiplex users.messages.get
+        requests; failures of individual sub-requests are logged and
+        skipped rather than failing the whole chunk.
+        """
+        if self.fetch_body:
+            # Full MIME tree, needed for LLM body extraction downstream
+            format_kwargs = {'format': 'full'}
+        else:
+            # Headers + labels + snippet only; much smaller responses
+            format_kwargs = {
+                'format': 'metadata',
+                'metadataHeaders': ['Date', 'Subject', 'From', 'To', 'Cc'],
+            }
+
+        get_requests = [
+            self.service.users().messages().get(
+                userId='me',
+                id=message_item['id'],
+                **format_kwargs
+            )
+            for message_item in message_items
+        ]
+
+        new_batch = getattr(self.service, 'new_batch_http_request', None)
+        if new_batch is None:
+            # Fallback: run the individual gets concurrently in threads
+            results = await asyncio.gather(
+                *(self._execute(request) for request in get_requests),
+                return_exceptions=True
+            )
+            return [r for r in results if not isinstance(r, Exception)]
+
+        fetched = []
+
+        def _collect(request_id, response, exception):
+            if exception is not None:
+                logger.error(
+                    "Error fetching Gmail message %s: %s", request_id, exception
+                )
+            elif response is not None:
+                fetched.append(response)
+
+        batch = new_batch(callback=_collect)
+        for message_item, request in zip(message_items, get_requests):
+            batch.add(request, request_id=message_item['id'])
+        # The multiplexed batch still counts against the concurrency quota
+        async with self._api_sem:
+            await asyncio.get_running_loop().run_in_executor(self._executor, batch.execute)
+
+        return fetched
+    
+    async def fetch_events_batch(self, batch_size: int = 50) -> AsyncIterator[list]:
+        """
+        Fetch emails from Gmail in batches of RawEvents.
+
+        Groups users.messages.get calls into one multipart HTTP batch
+        request per batch_size messages (Gmail allows up to 100), cutting
+        round-trips from N to ceil(N / batch_size) compared to
+        fetch_events.
+
+        Yields lists of RawEvent, one list per batch.
+        """
+        if not self.service:
+            raise RuntimeError("Not connected to Gmail. Call connect() first.")
+
         try:
             # Build query parameters
             query_params = {
-                'q': self.query,
+                'q': self._build_query(),
                 'maxResults': self.max_results,
             }
-            
+
             if self.label_ids:
                 query_params['labelIds'] = self.label_ids
-            
+
             # List messages
-            results = self.service.users().messages().list(
+            results = await self._execute(self.service.users().messages().list(
                 userId='me',
                 **query_params
-            ).execute()
-            
+            ))
+
             messages = results.get('messages', [])
-            
-            for message_item in messages:
-                message_id = message_item['id']
-                
-                # Get full message
-                message = self.service.users().messages().get(
-                    userId='me',
-                    id=message_id,
-                    format='full'
-                ).execute()
-                
-                # Convert to RawEvent
-                raw_event = self._message_to_event(message)
-                
-                # Check if already processed (has kiddo/processed label)
-                if await self.is_processed(raw_event):
-                    continue
-                
-                yield raw_event
-                
+
+            for start in range(0, len(messages), batch_size):
+                chunk = messages[start:start + batch_size]
+
+                events = [
+                    await self._message_to_event(message)
+                    for message in await self._batch_get(chunk)
+                    if not (self._processed_label_id
+                            and self._processed_label_id in message.get('labelIds', ()))
+                ]
+
+                if events:
+                    yield events
+
         except Exception as e:
             raise RuntimeError(f"Error fetching Gmail events: {e}")
-    
-    def _message_to_event(self, message: dict) -> RawEvent:
+
+    # Only these headers feed the event; the rest of a typical 40-header
+    # message is skipped without building an intermediate dict
+    _WANTED_HEADERS = frozenset({'Date', 'Subject', 'From', 'To', 'Cc'})
+
+    def _extract_headers(self, message: dict) -> dict:
+        """Extract the headers of interest from a message in a single pass."""
+        headers = {}
+        for header in message.get('payload', {}).get('headers', ()):
+            name = header['name']
+            if name in self._WANTED_HEADERS:
+                headers[name] = header['value']
+        return headers
+
+    # Bodies above this sizeEstimate are decoded in the thread pool; tiny
+    # messages stay inline so they don't pay the executor hand-off
+    _BODY_OFFLOAD_BYTES = 64 * 1024
+
+    async def _message_to_event(self, message: dict) -> RawEvent:
         """Convert Gmail message to RawEvent."""
         # Extract headers
-        headers = {h['name']: h['value'] for h in message.get('payload', {}).get('headers', [])}
+        headers = self._extract_headers(message)
+
+        # Extract timestamp. internalDate is server-assigned, always
+        # present, and integer millis — far cheaper than RFC 2822 parsing
+        # of the Date header, which stays behind an opt-in config gate
+        timestamp = None
+        if self.parse_date_header:
+            date_header = headers.get('Date')
+            if date_header:
+                try:
+                    timestamp = parsedate_to_datetime(date_header)
+                except (ValueError, TypeError):
+                    timestamp = None
+        if timestamp is None:
+            seconds, millis = divmod(int(message['internalDate']), 1000)
+            timestamp = datetime.fromtimestamp(
+                seconds, tz=timezone.utc
+            ).replace(microsecond=millis * 1000)
         
-        # Extract timestamp
-        date_header = headers.get('Date')
-        if date_header:
-            try:
-                timestamp = parsedate_to_datetime(date_header)
-            except (ValueError, TypeError):
-                timestamp = datetime.fromtimestamp(int(message['internalDate']) / 1000)
+        # Extract body content (absent in metadata-format responses).
+        # Decoding is pure CPU; large bodies go to the executor so MIME
+        # walking doesn't stall the event loop mid-fetch
+        if not self.fetch_body:
+            body_text = ''
+        elif message.get('sizeEstimate', 0) > self._BODY_OFFLOAD_BYTES:
+            body_text = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._extract_message_body, message.get('payload', {})
+            )
         else:
-            timestamp = datetime.fromtimestamp(int(message['internalDate']) / 1000)
-        
-        # Extract body content
-        body_text = self._extract_message_body(message.get('payload', {}))
+            body_text = self._extract_message_body(message.get('payload', {}))
         
         # Build payload
         payload = {
@@ -171,7 +483,6 @@ class GmailConnector(SourceConnector):
             'threadId': message.get('threadId'),
             'snippet': message.get('snippet', ''),
             'body': body_text,
-            'headers': headers,
             'subject': headers.get('Subject', ''),
             'from': headers.get('From', ''),
             'to': headers.get('To', ''),
@@ -198,38 +509,39 @@ class GmailConnector(SourceConnector):
         )
     
     def _extract_message_body(self, payload: dict) -> str:
-        """Extract text body from message payload."""
-        body_text = ""
-        
-        # Handle multipart messages
-        if 'parts' in payload:
-            for part in payload['parts']:
-                # Recursively handle nested parts
-                if 'parts' in part:
-                    body_text += self._extract_message_body(part)
-                else:
-                    # Extract text/plain or text/html
-                    mime_type = part.get('mimeType', '')
-                    if mime_type in ['text/plain', 'text/html']:
-                        data = part.get('body', {}).get('data')
-                        if data:
-                            try:
-                                decoded = base64.urlsafe_b64decode(data).decode('utf-8')
-                                body_text += decoded + "\n"
-                            except Exception:
-                                pass
-        else:
-            # Single part message
-            mime_type = payload.get('mimeType', '')
-            if mime_type in ['text/plain', 'text/html']:
-                data = payload.get('body', {}).get('data')
+        """
+        Extract text body from message payload.
+
+        Walks nested multipart trees with an explicit stack and joins the
+        decoded pieces once at the end, avoiding recursion and quadratic
+        string concatenation on deeply nested messages.
+        """
+        parts = [payload]
+        out = []
+
+        while parts:
+            part = parts.pop()
+            sub_parts = part.get('parts')
+            if sub_parts:
+                # Reversed so the LIFO pop keeps siblings in document order
+                parts.extend(reversed(sub_parts))
+                continue
+
+            # Extract text/plain or text/html
+            mime_type = part.get('mimeType', '')
+            if mime_type in ('text/plain', 'text/html'):
+                data = part.get('body', {}).get('data')
                 if data:
                     try:
-                        body_text = base64.urlsafe_b64decode(data).decode('utf-8')
-                    except Exception:
-                        pass
-        
-        return body_text.strip()
+                        raw = data.encode('ascii') if isinstance(data, str) else data
+                        decoded = binascii.a2b_base64(raw.translate(_B64_TRANS))
+                    except (binascii.Error, UnicodeEncodeError):
+                        # Skip malformed parts; one bad part must not
+                        # abort the whole fetch
+                        continue
+                    out.append(decoded.decode('utf-8', 'replace'))
+
+        return "\n".join(out).strip()
     
     async def health_check(self) -> bool:
         """Check if Gmail API is accessible."""
@@ -238,7 +550,7 @@ class GmailConnector(SourceConnector):
         
         try:
             # Try to get profile to verify connection
-            profile = self.service.users().getProfile(userId='me').execute()
+            profile = await self._execute(self.service.users().getProfile(userId='me'))
             return profile is not None
         except Exception:
             return False
@@ -252,58 +564,131 @@ class GmailConnector(SourceConnector):
             # Get or create the label
             label_id = await self._get_or_create_label(self.processed_label_name)
             self._processed_label_id = label_id
-        except Exception as e:
+        except Exception:
             # If label creation fails, log but don't fail the connection
-            print(f"Warning: Could not ensure processed label exists: {e}")
+            logger.warning("Could not ensure processed label exists", exc_info=True)
     
     async def _get_or_create_label(self, label_name: str) -> str:
         """Get existing label ID or create new label."""
         if not self.service:
             raise RuntimeError("Not connected to Gmail")
-        
-        # List all labels
-        labels = self.service.users().labels().list(userId='me').execute()
-        
+
+        # Check the in-process index, then the on-disk cache; a hit on
+        # either costs no API call
+        label_id = self._label_index.get(label_name)
+        if label_id:
+            return label_id
+
+        label_cache = self._load_label_cache()
+        label_id = label_cache.get(label_name)
+        if label_id:
+            self._label_index[label_name] = label_id
+            return label_id
+
+        # List all labels and index them by name, so later lookups for any
+        # label are O(1) instead of a scan over the full label list
+        labels = await self._execute(self.service.users().labels().list(userId='me'))
+        self._label_index = {
+            label['name']: label['id'] for label in labels.get('labels', [])
+        }
+
         # Check if label already exists
-        for label in labels.get('labels', []):
-            if label.get('name') == label_name:
-                return label['id']
-        
+        label_id = self._label_index.get(label_name)
+        if label_id:
+            label_cache[label_name] = label_id
+            self._save_label_cache(label_cache)
+            return label_id
+
         # Create new label if it doesn't exist
         label_body = {
             'name': label_name,
             'labelListVisibility': 'labelShow',
             'messageListVisibility': 'show'
         }
-        
-        created_label = self.service.users().labels().create(
+
+        created_label = await self._execute(self.service.users().labels().create(
             userId='me',
             body=label_body
-        ).execute()
-        
+        ))
+
+        self._label_index[label_name] = created_label['id']
+        label_cache[label_name] = created_label['id']
+        self._save_label_cache(label_cache)
         return created_label['id']
+
+    def _load_label_cache(self) -> dict:
+        """Load the persisted {label_name: label_id} map, if any."""
+        if not self._label_cache_path or not os.path.exists(self._label_cache_path):
+            return {}
+        try:
+            with open(self._label_cache_path, 'r') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _save_label_cache(self, label_cache: dict) -> None:
+        """Persist the label map next to the OAuth token (best effort)."""
+        if not self._label_cache_path:
+            return
+        try:
+            with open(self._label_cache_path, 'w') as f:
+                json.dump(label_cache, f)
+        except Exception:
+            pass
+
+    def _load_cursor(self):
+        """Load the persisted fetch cursor (Gmail historyId), if any."""
+        if not self._cursor_path or not os.path.exists(self._cursor_path):
+            return None
+        try:
+            with open(self._cursor_path, 'r') as f:
+                return json.load(f).get('history_id')
+        except Exception:
+            return None
+
+    def _save_cursor(self, history_id) -> None:
+        """Persist the fetch cursor next to the OAuth token (best effort)."""
+        if not self._cursor_path:
+            return
+        try:
+            with open(self._cursor_path, 'w') as f:
+                json.dump({'history_id': history_id}, f)
+        except Exception:
+            pass
+
+    def _invalidate_label_cache(self) -> None:
+        """Drop cached label IDs (e.g. after a 404 on a cached ID)."""
+        self._processed_label_id = None
+        self._label_index = {}
+        if self._label_cache_path and os.path.exists(self._label_cache_path):
+            try:
+                os.remove(self._label_cache_path)
+            except OSError:
+                pass
     
     async def is_processed(self, event: RawEvent) -> bool:
         """
         Check if Gmail message has been processed by checking for processed label.
-        
-        Note: This method is not in the base interface but is used internally
-        by fetch_events to skip already processed messages.
+
+        Note: This method is not in the base interface. The fetch loops test
+        the label IDs from the batched get() responses directly, so this
+        round-trip only runs for external callers that need a fresh answer.
         """
         if not event.event_id or not self.service:
             return False
         
-        # Extract message ID from event_id (format: "gmail_{message_id}")
-        message_id = event.event_id.replace("gmail_", "")
+        # The message ID is already stored verbatim in source_metadata;
+        # fall back to stripping the event_id prefix for foreign events
+        message_id = event.source_metadata.get('message_id') or event.event_id.removeprefix("gmail_")
         
         try:
             # Get message to check its labels
-            message = self.service.users().messages().get(
+            message = await self._execute(self.service.users().messages().get(
                 userId='me',
                 id=message_id,
                 format='metadata',
                 metadataHeaders=['']
-            ).execute()
+            ))
             
             # Get processed label ID if not cached
             if not self._processed_label_id:
@@ -313,9 +698,9 @@ class GmailConnector(SourceConnector):
             label_ids = message.get('labelIds', [])
             return self._processed_label_id in label_ids if self._processed_label_id else False
             
-        except Exception as e:
+        except Exception:
             # If we can't check, assume not processed
-            print(f"Error checking if message is processed: {e}")
+            logger.exception("Error checking if message is processed")
             return False
     
     async def mark_as_processed(self, event: RawEvent) -> bool:
@@ -323,8 +708,9 @@ class GmailConnector(SourceConnector):
         if not event.event_id or not self.service:
             return False
         
-        # Extract message ID from event_id (format: "gmail_{message_id}")
-        message_id = event.event_id.replace("gmail_", "")
+        # The message ID is already stored verbatim in source_metadata;
+        # fall back to stripping the event_id prefix for foreign events
+        message_id = event.source_metadata.get('message_id') or event.event_id.removeprefix("gmail_")
         
         try:
             # Ensure processed label exists
@@ -332,22 +718,77 @@ class GmailConnector(SourceConnector):
                 await self._ensure_processed_label()
             
             if not self._processed_label_id:
-                print("Warning: Could not get processed label ID")
+                logger.warning("Could not get processed label ID")
                 return False
             
             # Apply the label to the message
-            self.service.users().messages().modify(
+            await self._execute(self.service.users().messages().modify(
                 userId='me',
                 id=message_id,
                 body={'addLabelIds': [self._processed_label_id]}
-            ).execute()
+            ))
             
             return True
-            
+
         except Exception as e:
-            print(f"Error marking message as processed: {e}")
+            # A 404 can mean the cached label ID is stale (label deleted);
+            # drop the cache so the next attempt re-resolves it
+            if getattr(getattr(e, 'resp', None), 'status', None) == 404:
+                self._invalidate_label_cache()
+            logger.exception("Error marking message as processed")
             return False
     
+    # users.messages.batchModify accepts at most 1000 IDs per call
+    _BATCH_MODIFY_SIZE = 1000
+
+    async def mark_batch_as_processed(self, events: list) -> bool:
+        """
+        Mark a batch of Gmail messages as processed in one API call.
+
+        Uses users.messages.batchModify, which applies the label to up to
+        1000 message IDs per request — one round-trip per fetch cycle
+        instead of one per message. Prefer this over per-event
+        mark_as_processed at the end of a fetch.
+        """
+        if not self.service:
+            return False
+
+        message_ids = [
+            event.source_metadata['message_id']
+            for event in events
+            if event.source_metadata.get('message_id')
+        ]
+        if not message_ids:
+            return True
+
+        try:
+            # Ensure processed label exists
+            if not self._processed_label_id:
+                await self._ensure_processed_label()
+
+            if not self._processed_label_id:
+                logger.warning("Could not get processed label ID")
+                return False
+
+            for start in range(0, len(message_ids), self._BATCH_MODIFY_SIZE):
+                await self._execute(self.service.users().messages().batchModify(
+                    userId='me',
+                    body={
+                        'ids': message_ids[start:start + self._BATCH_MODIFY_SIZE],
+                        'addLabelIds': [self._processed_label_id],
+                    }
+                ))
+
+            return True
+
+        except Exception as e:
+            # A 404 can mean the cached label ID is stale (label deleted);
+            # drop the cache so the next attempt re-resolves it
+            if getattr(getattr(e, 'resp', None), 'status', None) == 404:
+                self._invalidate_label_cache()
+            logger.exception("Error marking message batch as processed")
+            return False
+
     def set_query(self, query: str) -> None:
         """
         Update the Gmail search query.
@@ -363,3 +804,20 @@ class GmailConnector(SourceConnector):
         """
         self.query = query
 
+
+def _build_gmail(source_id: str, connector_def: dict) -> GmailConnector:
+    """Build a GmailConnector from a connectors.yaml entry."""
+    gmail_config = {
+        "credentials_path": connector_def.get('credentials_path'),
+        "token_path": connector_def.get('token_path'),
+        "query": connector_def.get('query', 'is:unread'),
+        "max_results": connector_def.get('max_results', 100),
+        "processed_label": connector_def.get('processed_label', 'kiddo/processed'),
+        "label_ids": connector_def.get('label_ids'),
+        "fetch_body": connector_def.get('fetch_body', True),
+    }
+    return GmailConnector(source_id, gmail_config)
+
+
+register("gmail", _build_gmail)
+
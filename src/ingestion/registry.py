@@ -0,0 +1,38 @@
+"""Connector factory registry with lazy module loading."""
+
+import importlib
+from typing import Callable, Dict, Optional
+
+from .connector import SourceConnector
+
+ConnectorFactory = Callable[[str, dict], SourceConnector]
+
+# Factories registered by connector modules, keyed by connector type
+CONNECTOR_FACTORIES: Dict[str, ConnectorFactory] = {}
+
+# Modules that register a factory for each type, imported on first use so
+# startup only pays for connector types that appear in the configuration
+_LAZY_MODULES: Dict[str, str] = {
+    "gmail": "src.ingestion.adapters",
+}
+
+
+def register(connector_type: str, factory: ConnectorFactory) -> None:
+    """Register a factory for a connector type."""
+    CONNECTOR_FACTORIES[connector_type] = factory
+
+
+def get_factory(connector_type: str) -> Optional[ConnectorFactory]:
+    """
+    Get the factory for a connector type.
+
+    Imports the connector's module on first use so it can register itself.
+    Returns None for unknown (or not yet implemented) connector types.
+    """
+    factory = CONNECTOR_FACTORIES.get(connector_type)
+    if factory is None:
+        module_name = _LAZY_MODULES.get(connector_type)
+        if module_name:
+            importlib.import_module(module_name)
+            factory = CONNECTOR_FACTORIES.get(connector_type)
+    return factory
@@ -0,0 +1,34 @@
+"""Logging configuration."""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+
+
+def setup_logging(level: int = logging.INFO) -> None:
+    """
+    Configure root logging through a QueueHandler/QueueListener pair.
+
+    Emitting a record only enqueues it; formatting and stream I/O happen
+    on the listener's dedicated thread. Workers therefore never serialize
+    on the stdout lock or block the event loop behind a slow terminal,
+    which print() in the hot-path error handlers used to do.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter(
+        "%(asctime)s %(levelname)s %(name)s: %(message)s"
+    ))
+
+    listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
@@ -14,7 +14,7 @@ class SyncStatus(str, Enum):
     CONFLICT = "conflict"
 
 
-@dataclass
+@dataclass(slots=True)
 class CalendarEvent:
     """Calendar event representation."""
     calendar_provider: str
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class RawEvent:
     """Raw event from source."""
     source_id: str
@@ -15,7 +15,7 @@ class RawEvent:
     event_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StructuredEvent:
     """Structured event after processing."""
     event_id: str
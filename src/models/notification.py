@@ -14,7 +14,7 @@ class NotificationStatus(str, Enum):
     DELIVERED = "delivered"
 
 
-@dataclass
+@dataclass(slots=True)
 class Notification:
     """Notification representation."""
     notification_id: str
@@ -2,8 +2,6 @@
 
 from .engine import NotificationEngine
 from .channel import NotificationChannel
-from .sms_channel import SMSChannel
-from .email_channel import EmailChannel
 
 __all__ = [
     "NotificationEngine",
@@ -13,3 +11,13 @@ __all__ = [
 ]
 
 
+def __getattr__(name):
+    # Import channel implementations lazily so deployments without a
+    # given channel never load its module (or its SDK dependencies).
+    if name == "SMSChannel":
+        from .sms_channel import SMSChannel
+        return SMSChannel
+    if name == "EmailChannel":
+        from .email_channel import EmailChannel
+        return EmailChannel
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,6 +4,9 @@ import re
 from .channel import NotificationChannel
 from ..models.notification import Notification
 
+# Compiled once; validate_recipient runs per recipient on batch sends
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 
 class EmailChannel(NotificationChannel):
     """Email notification channel."""
@@ -27,7 +30,6 @@ class EmailChannel(NotificationChannel):
     
     async def validate_recipient(self, recipient: str) -> bool:
         """Validate email address format."""
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(email_pattern, recipient))
+        return _EMAIL_RE.match(recipient) is not None
 
 
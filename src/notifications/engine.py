@@ -1,5 +1,9 @@
 """Notification engine."""
 
+import asyncio
+import itertools
+import logging
+import uuid
 from typing import Dict, List
 from datetime import datetime
 
@@ -7,6 +11,8 @@ from ..models.event import StructuredEvent
 from ..models.notification import Notification, NotificationStatus
 from .channel import NotificationChannel
 
+logger = logging.getLogger(__name__)
+
 
 class NotificationEngine:
     """Main notification engine."""
@@ -14,6 +20,8 @@ class NotificationEngine:
     def __init__(self, channels: Dict[str, NotificationChannel]):
         """Initialize notification engine with channels."""
         self.channels = channels
+        # Monotonic counter keeps IDs collision-free under concurrent sends
+        self._counter = itertools.count()
     
     async def send_notification(
         self,
@@ -35,7 +43,7 @@ class NotificationEngine:
         
         # Create notification
         notification = Notification(
-            notification_id=f"notif_{datetime.now().timestamp()}",
+            notification_id=f"notif_{next(self._counter):08x}_{uuid.uuid4().hex[:8]}",
             event_id=event.event_id,
             channel=channel,
             recipient=recipient,
@@ -64,18 +72,22 @@ class NotificationEngine:
         message: str = None
     ) -> List[Notification]:
         """Send notifications to multiple channels and recipients."""
+        # Fan out all sends at once; wall-clock time is bounded by the
+        # slowest channel instead of the sum over every recipient
+        coros = [
+            self.send_notification(event, channel, recipient, message)
+            for channel, channel_recipients in recipients.items()
+            for recipient in channel_recipients
+        ]
+        results = await asyncio.gather(*coros, return_exceptions=True)
+
         notifications = []
-        for channel, channel_recipients in recipients.items():
-            for recipient in channel_recipients:
-                try:
-                    notification = await self.send_notification(
-                        event, channel, recipient, message
-                    )
-                    notifications.append(notification)
-                except Exception as e:
-                    # TODO: Log error
-                    print(f"Failed to send {channel} notification: {e}")
-        
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Failed to send notification: %s", result)
+            else:
+                notifications.append(result)
+
         return notifications
     
     def _generate_message(self, event: StructuredEvent) -> str:
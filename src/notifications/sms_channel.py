@@ -1,8 +1,13 @@
 """SMS notification channel."""
 
+import re
 from .channel import NotificationChannel
 from ..models.notification import Notification
 
+# Digits with optional + prefix, allowing spaces and dashes; one pass,
+# no intermediate string allocations
+_PHONE_RE = re.compile(r'^\+?[\d\s\-]+$')
+
 
 class SMSChannel(NotificationChannel):
     """SMS notification channel."""
@@ -26,8 +31,7 @@ class SMSChannel(NotificationChannel):
     
     async def validate_recipient(self, recipient: str) -> bool:
         """Validate phone number format."""
-        # TODO: Implement phone number validation
         # Basic check: should be digits, optionally with + prefix
-        return recipient.replace("+", "").replace("-", "").replace(" ", "").isdigit()
+        return _PHONE_RE.match(recipient) is not None and any(ch.isdigit() for ch in recipient)
 
 
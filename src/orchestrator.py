@@ -1,8 +1,17 @@
 """Main system orchestrator."""
 
 import asyncio
+import logging
+import os
 from typing import Dict, List
 
+# Bloom-filter dedup is optional; a plain set gives exact dedup at the
+# cost of unbounded memory on very long runs
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:
+    ScalableBloomFilter = None
+
 from .ingestion import SourceConnector
 from .queue import EventQueue
 from .processing import EventProcessingEngine
@@ -11,6 +20,8 @@ from .notifications import NotificationEngine
 from .models.event import RawEvent, StructuredEvent
 from .models.calendar import CalendarEvent
 
+logger = logging.getLogger(__name__)
+
 
 class SystemOrchestrator:
     """Main orchestrator for event processing system."""
@@ -21,7 +32,9 @@ class SystemOrchestrator:
         event_queue: EventQueue,
         processing_engine: EventProcessingEngine,
         calendar_providers: Dict[str, CalendarProvider],
-        notification_engine: NotificationEngine
+        notification_engine: NotificationEngine,
+        dedup_enabled: bool = True,
+        num_workers: int = None
     ):
         """Initialize orchestrator with all components."""
         self.connectors = connectors
@@ -32,26 +45,40 @@ class SystemOrchestrator:
         self.calendar_providers = calendar_providers
         self.notification_engine = notification_engine
         self.running = False
+        # Polling re-emits the same message IDs between windows; dropping
+        # duplicates here avoids redundant LLM work downstream
+        self.dedup_enabled = dedup_enabled
+        if ScalableBloomFilter is not None:
+            self._seen = ScalableBloomFilter(
+                initial_capacity=100_000, error_rate=1e-4
+            )
+        else:
+            self._seen = set()
+        # Event processing is network-bound (LLM, calendar, notification
+        # calls), so several workers drain the queue concurrently
+        self.num_workers = num_workers or min(32, (os.cpu_count() or 1) * 4)
+        self._work_q = None
     
     async def start(self):
         """Start the system."""
         self.running = True
-        
-        # Connect all source connectors
-        for connector in self.connectors:
-            await connector.connect()
-        
-        # Start ingestion tasks
-        ingestion_tasks = [
-            self._ingestion_loop(connector)
-            for connector in self.connectors
-        ]
-        
-        # Start processing task
-        processing_task = self._processing_loop()
-        
-        # Run all tasks
-        await asyncio.gather(*ingestion_tasks, processing_task)
+
+        # Connect all source connectors concurrently; startup time is the
+        # slowest handshake instead of the sum of all of them
+        await asyncio.gather(
+            *(connector.connect() for connector in self.connectors)
+        )
+
+        self._work_q = asyncio.Queue(maxsize=self.num_workers * 4)
+
+        # TaskGroup gives structured cancellation: if any loop dies, the
+        # rest are cancelled instead of silently orphaned by gather
+        async with asyncio.TaskGroup() as tg:
+            for connector in self.connectors:
+                tg.create_task(self._ingestion_loop(connector))
+            tg.create_task(self._processing_loop())
+            for _ in range(self.num_workers):
+                tg.create_task(self._worker())
     
     async def stop(self):
         """Stop the system."""
@@ -60,72 +87,100 @@ class SystemOrchestrator:
         # Disconnect all connectors
         for connector in self.connectors:
             await connector.disconnect()
+
+        # Release the pooled LLM HTTP connections
+        await self.processing_engine.llm_service.aclose()
     
     async def _ingestion_loop(self, connector: SourceConnector):
         """Ingestion loop for a connector."""
         while self.running:
             try:
                 async for event in connector.fetch_events():
+                    if self.dedup_enabled:
+                        key = f"{connector.source_id}:{event.event_id}"
+                        if key in self._seen:
+                            continue
+                        self._seen.add(key)
                     await self.event_queue.publish(event)
-            except Exception as e:
+            except Exception:
                 # TODO: Handle errors, retry logic
-                print(f"Error in ingestion loop for {connector.source_id}: {e}")
+                logger.exception(
+                    "Error in ingestion loop for %s", connector.source_id
+                )
                 await asyncio.sleep(5)  # Backoff
     
     async def _processing_loop(self):
-        """Main processing loop."""
+        """Feed consumed events to the worker pool."""
         while self.running:
             try:
-                async for raw_event in self.event_queue.consume():
-                    try:
-                        # Process event
-                        structured_event = await self.processing_engine.process_event(
-                            raw_event
-                        )
-                        
-                        # Integrate with calendar
-                        await self._integrate_calendar(structured_event)
-                        
-                        # Send notifications if needed
-                        await self._send_notifications(structured_event)
-                        
-                        # Mark event as processed in source connector
-                        connector = self.connector_map.get(raw_event.source_id)
-                        if connector:
-                            await connector.mark_as_processed(raw_event)
-                        
-                        # Acknowledge event
-                        await self.event_queue.ack(raw_event.event_id or "")
-                        
-                    except Exception as e:
-                        # TODO: Handle processing errors
-                        print(f"Error processing event: {e}")
-                        await self.event_queue.nack(
-                            raw_event.event_id or "",
-                            requeue=True
-                        )
-            except Exception as e:
-                print(f"Error in processing loop: {e}")
+                # Plain await skips the async-generator yield machinery
+                # that consume() pays per event
+                raw_event = await self.event_queue.get()
+                # Blocks when workers are saturated, so the queue
+                # back-pressures instead of buffering unboundedly
+                await self._work_q.put(raw_event)
+            except Exception:
+                logger.exception("Error in processing loop")
                 await asyncio.sleep(1)
+
+    async def _worker(self):
+        """Process events from the work queue until shutdown."""
+        while self.running:
+            raw_event = await self._work_q.get()
+            try:
+                # Process event
+                structured_event = await self.processing_engine.process_event(
+                    raw_event
+                )
+
+                # Integrate with calendar
+                await self._integrate_calendar(structured_event)
+
+                # Send notifications if needed
+                await self._send_notifications(structured_event)
+
+                # Mark event as processed in source connector
+                connector = self.connector_map.get(raw_event.source_id)
+                if connector:
+                    await connector.mark_as_processed(raw_event)
+
+                # Acknowledge event
+                await self.event_queue.ack(raw_event.event_id or "")
+
+            except Exception:
+                # TODO: Handle processing errors
+                logger.exception("Error processing event %s", raw_event.event_id)
+                await self.event_queue.nack(
+                    raw_event.event_id or "",
+                    requeue=True
+                )
+            finally:
+                self._work_q.task_done()
     
     async def _integrate_calendar(self, event: StructuredEvent):
         """Integrate event with calendar providers."""
         # TODO: Determine which calendar(s) to use based on configuration
-        for provider_name, provider in self.calendar_providers.items():
-            try:
-                # Get default calendar ID (should come from config)
-                calendar_id = "primary"  # TODO: Get from config
-                
-                calendar_event = await provider.create_event(
-                    event,
-                    calendar_id
-                )
-                
-                # TODO: Store calendar_event mapping
-                
-            except Exception as e:
+        if not self.calendar_providers:
+            return
+
+        # Get default calendar ID (should come from config)
+        calendar_id = "primary"  # TODO: Get from config
+
+        # All providers are independent APIs; fire them concurrently so
+        # per-event latency is the slowest provider, not the sum
+        results = await asyncio.gather(
+            *(provider.create_event(event, calendar_id)
+              for provider in self.calendar_providers.values()),
+            return_exceptions=True
+        )
+
+        for provider_name, result in zip(self.calendar_providers, results):
+            if isinstance(result, Exception):
                 # TODO: Handle calendar errors
-                print(f"Error integrating with {provider_name}: {e}")
+                logger.error(
+                    "Error integrating with %s: %s", provider_name, result
+                )
+            # TODO: Store calendar_event mapping
     
     async def _send_notifications(self, event: StructuredEvent):
         """Send notifications for event."""
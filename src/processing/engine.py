@@ -1,5 +1,12 @@
 """Event processing engine."""
 
+import asyncio
+import copy
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
 from typing import Optional
 
 from ..models.event import RawEvent, StructuredEvent
@@ -7,6 +14,8 @@ from .normalizer import EventNormalizer
 from .llm_service import LLMService
 from .extractor import DataExtractor
 
+logger = logging.getLogger(__name__)
+
 
 class EventProcessingEngine:
     """Main event processing engine."""
@@ -15,13 +24,62 @@ class EventProcessingEngine:
         self,
         normalizer: EventNormalizer,
         llm_service: LLMService,
-        extractor: DataExtractor
+        extractor: DataExtractor,
+        result_cache_size: int = 4096,
+        result_cache_ttl: float = 7 * 86400
     ):
-        """Initialize processing engine."""
+        """
+        Initialize processing engine.
+
+        Args:
+            normalizer: Event normalizer
+            llm_service: LLM extraction service
+            extractor: Structured-data extractor
+            result_cache_size: Maximum cached pipeline results
+                (0 disables the cache)
+            result_cache_ttl: Seconds a cached result stays reusable
+        """
         self.normalizer = normalizer
         self.llm_service = llm_service
         self.extractor = extractor
-    
+        # Recurring notices (weekly school mail) repeat the same content
+        # verbatim; caching the finished StructuredEvent by content hash
+        # skips the LLM and extraction steps entirely for repeats.
+        # Insertion order doubles as LRU order; the TTL keeps results
+        # from outliving their relevance.
+        self._result_cache_size = result_cache_size
+        self._result_cache_ttl = result_cache_ttl
+        self._result_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+
+    def _cached_result(self, key: bytes) -> Optional[StructuredEvent]:
+        """Return a cloned cached result for key, or None."""
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, structured = entry
+        if time.monotonic() >= expires_at:
+            del self._result_cache[key]
+            return None
+        self._result_cache.move_to_end(key)
+        # Fresh event_id so downstream steps (calendar, ack) treat the
+        # clone as its own event
+        clone = copy.deepcopy(structured)
+        clone.event_id = os.urandom(16).hex()
+        return clone
+
+    def _store_result(self, key: bytes, structured: StructuredEvent) -> None:
+        """Cache a pipeline result, evicting expired/LRU entries."""
+        if self._result_cache_size <= 0:
+            return
+        self._result_cache[key] = (
+            time.monotonic() + self._result_cache_ttl,
+            copy.deepcopy(structured)
+        )
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > self._result_cache_size:
+            self._result_cache.popitem(last=False)
+
+
     async def process_event(self, raw_event: RawEvent) -> StructuredEvent:
         """
         Process raw event through normalization, LLM extraction, and validation.
@@ -32,38 +90,56 @@ class EventProcessingEngine:
         3. Extract and validate structured data
         4. Return structured event
         """
-        # Step 1: Normalize
-        normalized = await self.normalizer.normalize(raw_event)
-        
+        # Step 1: Normalize (pure CPU, so no await)
+        normalized = self.normalizer.normalize(raw_event)
+
+        # Identical content short-circuits straight to the cached result
+        content_key = hashlib.sha256(
+            normalized.get("raw_content", "").encode()
+        ).digest()
+        cached = self._cached_result(content_key)
+        if cached is not None:
+            cached.source_reference = normalized.get("source_id")
+            return cached
+
         # Step 2: Determine event type hint and prompt task
         event_type_hint = None
         prompt_task = normalized.get("metadata", {}).get("prompt_task")
         
-        # Step 3: LLM extraction with appropriate prompt
-        extraction_result = await self.llm_service.extract_event_details(
+        # Step 3: LLM extraction with appropriate prompt. Submissions are
+        # micro-batched by the service, so events processed concurrently
+        # (e.g. via process_batch or the worker pool) share one dispatch
+        extraction_result = await self.llm_service.submit_extraction(
             normalized,
             event_type_hint=event_type_hint,
             prompt_task=prompt_task
         )
         
-        # Step 3: Extract and validate
-        structured = await self.extractor.extract(
+        # Step 3: Extract and validate (pure CPU, so no await)
+        structured = self.extractor.extract(
             normalized,
             extraction_result
         )
-        
+
+        self._store_result(content_key, structured)
         return structured
     
     async def process_batch(self, raw_events: list[RawEvent]) -> list[StructuredEvent]:
         """Process multiple events in batch."""
-        # TODO: Implement batch processing with parallelization
+        # Concurrent processing lets the LLM service coalesce the
+        # extractions into micro-batches instead of one call per event
+        outcomes = await asyncio.gather(
+            *(self.process_event(event) for event in raw_events),
+            return_exceptions=True
+        )
         results = []
-        for event in raw_events:
-            try:
-                structured = await self.process_event(event)
-                results.append(structured)
-            except Exception as e:
+        for event, outcome in zip(raw_events, outcomes):
+            if isinstance(outcome, Exception):
                 # TODO: Handle errors, send to dead-letter queue
-                print(f"Error processing event {event.event_id}: {e}")
+                logger.error(
+                    "Error processing event %s: %s", event.event_id, outcome
+                )
+            else:
+                results.append(outcome)
         return results
 
@@ -1,12 +1,54 @@
 """LLM service integration."""
 
+import asyncio
+import copy
+import hashlib
 import json
+import logging
+from collections import OrderedDict, deque
 from typing import Dict, Any, Optional
 from datetime import datetime
 import uuid
 
 from .prompt_manager import PromptManager, Prompt
 
+# Pooled async HTTP client for LLM calls; optional (llm extra)
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Rust-backed JSON codec, 3-10x faster than the stdlib on LLM response
+# payloads; optional (performance extra)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _json_loads(data):
+    """Parse a JSON document (bytes or str) with the fastest codec available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """
+    Serialize obj to JSON bytes.
+
+    With orjson, dataclasses (StructuredEvent) and datetimes serialize
+    natively without per-field conversion; the stdlib fallback goes
+    through default=str.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_DATACLASS
+        )
+    return json.dumps(obj, default=str).encode()
+
 
 class LLMService:
     """Service for LLM-based event extraction."""
@@ -16,21 +58,52 @@ class LLMService:
         api_key: Optional[str] = None,
         model: str = "gpt-4",
         prompt_manager: Optional[PromptManager] = None,
-        prompts_dir: Optional[str] = None
+        prompts_dir: Optional[str] = None,
+        semantic_cache_threshold: float = 0.92,
+        semantic_cache_size: int = 1024,
+        max_batch: int = 16,
+        flush_ms: int = 50
     ):
         """
         Initialize LLM service.
-        
+
         Args:
             api_key: LLM API key
             model: LLM model name
             prompt_manager: Optional PromptManager instance. If None, creates one.
             prompts_dir: Directory containing prompt YAML files (used if prompt_manager is None)
+            semantic_cache_threshold: Minimum cosine similarity for a cached
+                extraction to be reused (0 disables the cache)
+            semantic_cache_size: Maximum cached extractions per prompt
+            max_batch: Extractions coalesced into one provider batch
+            flush_ms: Longest a queued extraction waits for batch-mates
         """
         self.api_key = api_key
         self.model = model
         self.prompt_manager = prompt_manager or PromptManager(prompts_dir=prompts_dir)
-        # TODO: Initialize LLM client
+        # Semantic cache: repetitive inboxes (newsletters, recurring
+        # invites) produce near-identical bodies, so an embedding lookup
+        # replaces most LLM round-trips. Keyed per prompt name so
+        # different extraction tasks never share entries.
+        self._semantic_threshold = semantic_cache_threshold
+        self._semantic_cache_size = semantic_cache_size
+        self._semantic_cache: Dict[str, deque] = {}
+        self._embedder = None  # Lazily loaded; False when unavailable
+        # Exact-match cache: byte-identical inputs (duplicate emails,
+        # redelivery after nack) short-circuit before any embedding or
+        # API work. Insertion order doubles as LRU order.
+        self._exact_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._exact_cache_size = 4096
+        # Micro-batching: submissions wait briefly so per-request HTTP and
+        # auth overhead amortizes across a whole batch
+        self.max_batch = max_batch
+        self.flush_ms = flush_ms
+        self._pending: list = []
+        self._flush_handle = None
+        # One pooled HTTP client shared by every LLM call (including
+        # SMSGenerator, which routes through this service); created on
+        # first use so importing the service doesn't require httpx
+        self._client = None
     
     async def extract_event_details(
         self,
@@ -70,26 +143,34 @@ class LLMService:
             # Try to get content from other fields
             event_content = str(normalized_event.get("raw_payload", ""))
         
-        # Prepare template variables based on prompt task
-        template_vars = {"event_content": event_content}
-        
-        # Add email-specific fields for mail_to_calendar prompt
-        if prompt_task == "extract_mail_to_calendar":
-            template_vars["subject"] = normalized_event.get("subject", "")
-            template_vars["from_email"] = normalized_event.get("from_email", "")
-        
-        # Add email fields for school extraction (if available)
-        if prompt_task == "extract_school_event":
-            if "subject" in normalized_event:
-                template_vars["subject"] = normalized_event.get("subject", "")
-            if "from_email" in normalized_event:
-                template_vars["from_email"] = normalized_event.get("from_email", "")
+        # Fill only the fields the template references; required_vars is
+        # precomputed at load time, so no per-task branching or template
+        # re-parsing happens per event
+        template_vars = {
+            name: normalized_event.get(name, "")
+            for name in prompt.required_vars
+            if name != "event_content"
+        }
+        template_vars["event_content"] = event_content
         
+        # Byte-identical inputs reuse the previous extraction outright
+        exact_key = self._exact_key(prompt.name, template_vars)
+        cached = self._exact_cache.get(exact_key)
+        if cached is not None:
+            self._exact_cache.move_to_end(exact_key)
+            return copy.deepcopy(cached)
+
         # Format prompt with template variables
         system_prompt, user_prompt = self.prompt_manager.format_prompt(
             prompt,
             **template_vars
         )
+
+        # Cache-friendly block form for providers with prefix caching
+        _, content_blocks = self.prompt_manager.format_prompt_blocks(
+            prompt,
+            **template_vars
+        )
         
         # TODO: Implement actual LLM API call
         # This should:
@@ -101,31 +182,80 @@ class LLMService:
         # Placeholder: Simulate LLM response parsing
         # In real implementation, this would call the LLM API
         try:
+            # Reuse a previous extraction for near-identical content.
+            # Model load and encoding are blocking CPU work, so they run
+            # off the event loop
+            embedding = await asyncio.to_thread(self._embed, event_content)
+            if embedding is not None:
+                cached = self._semantic_lookup(prompt.name, embedding)
+                if cached is not None:
+                    return copy.deepcopy(cached)
+
             # For now, return a placeholder structure
             # Real implementation would parse LLM JSON response
-            extracted_data = await self._call_llm_api(system_prompt, user_prompt, prompt)
+            extracted_data = await self._call_llm_api(
+                system_prompt, user_prompt, prompt, content_blocks=content_blocks
+            )
+            if embedding is not None:
+                self._semantic_store(prompt.name, embedding, extracted_data)
+            self._exact_store(exact_key, extracted_data)
             return extracted_data
-        except Exception as e:
+        except Exception:
             # Fallback to basic extraction
-            print(f"Error calling LLM API: {e}")
+            logger.exception("Error calling LLM API")
             return self._fallback_extraction(normalized_event)
     
+    def http_client(self):
+        """
+        Shared httpx.AsyncClient for all LLM HTTP traffic.
+
+        Keep-alive pooling means one TCP+TLS handshake serves many calls
+        instead of one per request; HTTP/2 multiplexes concurrent calls
+        over the same connection.
+        """
+        if httpx is None:
+            raise RuntimeError(
+                "httpx is required for LLM API calls. "
+                "Install with: pip install kiddo[llm]"
+            )
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=100, max_keepalive_connections=50
+                ),
+                timeout=30,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client (no-op if never used)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     async def _call_llm_api(
         self,
         system_prompt: str,
         user_prompt: str,
-        prompt: Prompt
+        prompt: Prompt,
+        content_blocks: Optional[list] = None
     ) -> Dict[str, Any]:
         """
         Call LLM API with formatted prompts.
-        
+
+        content_blocks carries the prompt split into a cache_control-marked
+        static prefix plus per-event suffix; providers supporting prefix
+        caching should be sent the blocks rather than the flat user_prompt.
+
         TODO: Implement actual LLM API integration (OpenAI, Anthropic, etc.)
         """
         # Placeholder implementation
         # Real implementation would:
-        # 1. Initialize LLM client (OpenAI, Anthropic, etc.)
-        # 2. Make API call with system and user prompts
-        # 3. Parse JSON response
+        # 1. Make the API call over self.http_client() (shared pool),
+        #    serializing the request body with _json_dumps
+        # 2. Send system and user prompts (blocks form when supported)
+        # 3. Parse the raw response bytes with _json_loads
         # 4. Handle rate limiting and retries
         
         # For now, return placeholder structure
@@ -141,6 +271,79 @@ class LLMService:
             "priority": "normal",
         }
     
+    def _exact_key(self, prompt_name: str, template_vars: Dict[str, Any]) -> bytes:
+        """Hash the model, prompt and template inputs into a cache key."""
+        hasher = hashlib.blake2b(digest_size=16)
+
+        def _update(part: str) -> None:
+            # Length-prefix every field so adjacent values can't collide
+            # by shifting bytes across field boundaries
+            data = part.encode()
+            hasher.update(len(data).to_bytes(8, 'little'))
+            hasher.update(data)
+
+        _update(self.model)
+        _update(prompt_name)
+        for name in sorted(template_vars):
+            value = template_vars[name]
+            _update(name)
+            # Tag the type so e.g. '1' and 1 hash differently
+            if isinstance(value, str):
+                _update('s:' + value)
+            else:
+                _update('r:' + repr(value))
+        return hasher.digest()
+
+    def _exact_store(self, key: bytes, result: Dict[str, Any]) -> None:
+        """Cache a successful extraction, evicting the least recently used."""
+        self._exact_cache[key] = copy.deepcopy(result)
+        self._exact_cache.move_to_end(key)
+        while len(self._exact_cache) > self._exact_cache_size:
+            self._exact_cache.popitem(last=False)
+
+    def _embed(self, text: str):
+        """
+        Embed text for the semantic cache, or None when caching is off.
+
+        The sentence-transformers model loads on first use; if the
+        optional dependency is missing the cache silently disables itself.
+        """
+        if self._semantic_threshold <= 0 or self._embedder is False:
+            return None
+        if self._embedder is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+                self._embedder = SentenceTransformer("all-MiniLM-L6-v2")
+            except ImportError:
+                self._embedder = False
+                return None
+        # Normalized vectors make cosine similarity a plain dot product
+        return self._embedder.encode(text, normalize_embeddings=True)
+
+    def _semantic_lookup(self, prompt_name: str, embedding) -> Optional[Dict[str, Any]]:
+        """Return the cached extraction most similar to embedding, if close enough."""
+        entries = self._semantic_cache.get(prompt_name)
+        if not entries:
+            return None
+        best_score = self._semantic_threshold
+        best_result = None
+        for cached_embedding, result in entries:
+            score = float(cached_embedding @ embedding)
+            if score >= best_score:
+                best_score = score
+                best_result = result
+        return best_result
+
+    def _semantic_store(self, prompt_name: str, embedding, result: Dict[str, Any]) -> None:
+        """Cache an extraction; the oldest entry is evicted at capacity."""
+        entries = self._semantic_cache.get(prompt_name)
+        if entries is None:
+            entries = self._semantic_cache[prompt_name] = deque(
+                maxlen=self._semantic_cache_size
+            )
+        # Stored copy stays isolated from mutations by the caller
+        entries.append((embedding, copy.deepcopy(result)))
+
     def _fallback_extraction(self, normalized_event: Dict[str, Any]) -> Dict[str, Any]:
         """Fallback extraction when LLM API fails."""
         return {
@@ -155,12 +358,60 @@ class LLMService:
             "priority": "normal",
         }
     
+    async def submit_extraction(
+        self,
+        normalized_event: Dict[str, Any],
+        event_type_hint: Optional[str] = None,
+        prompt_task: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Queue an extraction for micro-batched dispatch.
+
+        Submissions are held until max_batch items accumulate or flush_ms
+        elapses, then dispatched together, so concurrent callers share
+        one provider round-trip instead of paying per-request overhead.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append(
+            (future, (normalized_event, event_type_hint, prompt_task))
+        )
+        if len(self._pending) >= self.max_batch:
+            self._flush_pending()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                self.flush_ms / 1000, self._flush_pending
+            )
+        return await future
+
+    def _flush_pending(self) -> None:
+        """Dispatch all queued extractions as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, []
+        if pending:
+            asyncio.ensure_future(self._run_batch(pending))
+
+    async def _run_batch(self, pending: list) -> None:
+        """Run one coalesced batch and resolve the waiting futures."""
+        # TODO: Issue a single provider batch request here (OpenAI
+        # /v1/batches, Anthropic Message Batches) instead of fanning out
+        results = await asyncio.gather(
+            *(self.extract_event_details(*args) for _, args in pending),
+            return_exceptions=True
+        )
+        for (future, _), result in zip(pending, results):
+            if future.cancelled():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
     async def extract_batch(self, normalized_events: list[Dict[str, Any]]) -> list[Dict[str, Any]]:
         """Extract details for multiple events (batch processing)."""
-        # TODO: Implement batch extraction for efficiency
-        results = []
-        for event in normalized_events:
-            result = await self.extract_event_details(event)
-            results.append(result)
-        return results
+        return await asyncio.gather(
+            *(self.submit_extraction(event) for event in normalized_events)
+        )
 
@@ -1,18 +1,44 @@
 """Event normalization."""
 
+import re
+from functools import lru_cache
 from typing import Dict, Any
 
 from ..models.event import RawEvent
 
+# Payload fields that may carry the event text, in preference order
+_CONTENT_FIELDS = ("body", "content", "text", "message", "description")
+_SENTINEL = object()
+
+# Case-insensitive search skips materializing a lowered copy of the
+# subject on every event
+_CALENDAR_RE = re.compile(r"dodaj do kalendarza", re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _lower(s: str) -> str:
+    """Memoized str.lower; repeat senders reuse one lowered string."""
+    return s.lower()
+
 
 class EventNormalizer:
     """Normalize events from various sources to canonical format."""
-    
-    async def normalize(self, raw_event: RawEvent) -> Dict[str, Any]:
+
+    _SCHOOL_INDICATORS = (
+        "szkola", "szkoła", "przedszkole", "edu.pl",
+        "sp", "gimnazjum", "liceum", "nauczyciel",
+        "dyrektor", "sekretariat"
+    )
+    # One compiled alternation scans the address once instead of ten
+    # Python-level substring passes per email
+    _SCHOOL_RE = re.compile("|".join(re.escape(i) for i in _SCHOOL_INDICATORS))
+
+    def normalize(self, raw_event: RawEvent) -> Dict[str, Any]:
         """
         Normalize raw event to canonical format.
-        
-        Returns normalized event data ready for LLM processing.
+
+        Returns normalized event data ready for LLM processing. Pure CPU
+        work, so this is a plain function rather than a coroutine.
         """
         normalized = {
             "source_id": raw_event.source_id,
@@ -25,13 +51,13 @@ class EventNormalizer:
         if raw_event.source_metadata.get("type") == "gmail":
             payload = raw_event.raw_payload
             subject = payload.get("subject", "")
-            from_email = payload.get("from", "").lower()
-            
+            from_email = _lower(payload.get("from", ""))
+
             normalized["subject"] = subject
             normalized["from_email"] = from_email
-            
+
             # Detect "dodaj do kalendarza" in title/subject
-            if "dodaj do kalendarza" in subject.lower():
+            if _CALENDAR_RE.search(subject):
                 normalized["metadata"]["prompt_task"] = "extract_mail_to_calendar"
             
             # Detect school/kindergarten based on sender
@@ -42,19 +68,15 @@ class EventNormalizer:
     
     def _is_school_sender(self, from_email: str) -> bool:
         """Check if sender is from school/kindergarten."""
-        school_indicators = [
-            "szkola", "szkoła", "przedszkole", "edu.pl", 
-            "sp", "gimnazjum", "liceum", "nauczyciel", 
-            "dyrektor", "sekretariat"
-        ]
-        return any(indicator in from_email for indicator in school_indicators)
+        return self._SCHOOL_RE.search(from_email) is not None
     
     def _extract_content(self, payload: Dict[str, Any]) -> str:
         """Extract text content from payload for LLM processing."""
         if isinstance(payload, dict):
-            for field in ["body", "content", "text", "message", "description"]:
-                if field in payload:
-                    return str(payload[field])
-            return str(payload)
+            # Sentinel get() halves the dict lookups vs `in` + access
+            for field in _CONTENT_FIELDS:
+                value = payload.get(field, _SENTINEL)
+                if value is not _SENTINEL:
+                    return str(value)
         return str(payload)
 
@@ -1,11 +1,36 @@
 """Prompt management for LLM processing."""
 
+import logging
 import os
+import re
+import string
 import yaml
+from functools import lru_cache
+
+# Parse with libyaml when PyYAML was built against it; the C loader is
+# an order of magnitude faster than the pure-Python SafeLoader
+try:
+    _YamlLoader = yaml.CSafeLoader
+except AttributeError:
+    _YamlLoader = yaml.SafeLoader
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=4096)
+def _format_cached(template: str, items: tuple) -> str:
+    """
+    Memoized str.format over a tuple-keyed variable set.
+
+    Events frequently repeat the same extracted fields (identical
+    subjects, empty bodies), and str.format re-parses the template each
+    call; caching skips both for repeats.
+    """
+    return template.format(**dict(items))
+
 
 @dataclass
 class Prompt:
@@ -16,6 +41,9 @@ class Prompt:
     system_prompt: str
     user_prompt_template: str
     output_format: str = "json"
+    # Replacement fields the template references, precomputed at load
+    # time so callers don't re-parse the template per event
+    required_vars: frozenset = frozenset()
 
 
 class PromptManager:
@@ -36,45 +64,102 @@ class PromptManager:
         
         self.prompts_dir = Path(prompts_dir)
         self.prompts: Dict[str, Prompt] = {}
+        # {prompt name: (static prefix, variable suffix)} template splits
+        self._prefix_splits: Dict[str, Tuple[str, str]] = {}
+        # Lazy loading: files are only enumerated here and parsed on first
+        # lookup, so startup doesn't pay YAML parsing for unused prompts
+        self._pending: Dict[str, Path] = {}
+        self._sources: Dict[str, Path] = {}  # identifier -> source file
+        self._mtimes: Dict[Path, int] = {}
         self._load_prompts()
-    
+
     def _load_prompts(self) -> None:
-        """Load all prompt YAML files from the prompts directory."""
+        """Enumerate prompt YAML files; parsing is deferred until lookup."""
         if not self.prompts_dir.exists():
-            print(f"Warning: Prompts directory not found: {self.prompts_dir}")
+            logger.warning("Prompts directory not found: %s", self.prompts_dir)
             return
-        
+
         for yaml_file in self.prompts_dir.glob("*.yaml"):
-            try:
-                with open(yaml_file, 'r', encoding='utf-8') as f:
-                    prompt_data = yaml.safe_load(f)
-                
-                prompt = Prompt(
-                    name=prompt_data.get('name', yaml_file.stem),
-                    description=prompt_data.get('description', ''),
-                    task=prompt_data.get('task', 'extract_event_details'),
-                    system_prompt=prompt_data.get('system_prompt', ''),
-                    user_prompt_template=prompt_data.get('user_prompt_template', ''),
-                    output_format=prompt_data.get('output_format', 'json')
+            self._pending[yaml_file.stem] = yaml_file
+
+    def _load_file(self, yaml_file: Path) -> Optional[Prompt]:
+        """Parse one prompt file and index it by name and task."""
+        try:
+            mtime = os.stat(yaml_file).st_mtime_ns
+            with open(yaml_file, 'r', encoding='utf-8') as f:
+                prompt_data = yaml.load(f, Loader=_YamlLoader)
+
+            user_prompt_template = prompt_data.get('user_prompt_template', '')
+            prompt = Prompt(
+                name=prompt_data.get('name', yaml_file.stem),
+                description=prompt_data.get('description', ''),
+                task=prompt_data.get('task', 'extract_event_details'),
+                system_prompt=prompt_data.get('system_prompt', ''),
+                user_prompt_template=user_prompt_template,
+                output_format=prompt_data.get('output_format', 'json'),
+                required_vars=frozenset(
+                    name for _, name, _, _
+                    in string.Formatter().parse(user_prompt_template)
+                    if name
                 )
-                
-                # Index by both name and task
-                self.prompts[prompt.name] = prompt
-                self.prompts[prompt.task] = prompt
-                
-            except Exception as e:
-                print(f"Error loading prompt from {yaml_file}: {e}")
-    
+            )
+
+            # Index by both name and task
+            self.prompts[prompt.name] = prompt
+            self.prompts[prompt.task] = prompt
+            self._sources[prompt.name] = yaml_file
+            self._sources[prompt.task] = yaml_file
+            self._mtimes[yaml_file] = mtime
+            # A reloaded template needs a fresh prefix split
+            self._prefix_splits.pop(prompt.name, None)
+            return prompt
+
+        except Exception:
+            logger.exception("Error loading prompt from %s", yaml_file)
+            return None
+        finally:
+            self._pending.pop(yaml_file.stem, None)
+
+    def _refresh_if_stale(self, identifier: str) -> None:
+        """Reload a prompt whose source file changed since it was parsed."""
+        yaml_file = self._sources.get(identifier)
+        if yaml_file is None:
+            return
+        try:
+            mtime = os.stat(yaml_file).st_mtime_ns
+        except OSError:
+            return
+        if mtime != self._mtimes.get(yaml_file):
+            self._load_file(yaml_file)
+
     def get_prompt(self, identifier: str) -> Optional[Prompt]:
         """
         Get a prompt by name or task identifier.
-        
+
         Args:
             identifier: Prompt name or task name
-            
+
         Returns:
             Prompt object or None if not found
         """
+        if identifier in self.prompts:
+            self._refresh_if_stale(identifier)
+            return self.prompts.get(identifier)
+
+        # File stems usually match prompt names, so try that file first
+        yaml_file = self._pending.get(identifier)
+        if yaml_file is not None:
+            self._load_file(yaml_file)
+            if identifier in self.prompts:
+                return self.prompts[identifier]
+
+        # Task identifiers only surface after parsing, so fall back to
+        # loading the remaining files (each file parses at most once)
+        for yaml_file in list(self._pending.values()):
+            self._load_file(yaml_file)
+            if identifier in self.prompts:
+                return self.prompts[identifier]
+
         return self.prompts.get(identifier)
     
     def get_prompt_for_event_type(self, event_type: Optional[str] = None) -> Optional[Prompt]:
@@ -96,6 +181,61 @@ class PromptManager:
         # Default to general event extraction
         return self.get_prompt("event_extraction") or self.get_prompt("extract_event_details")
     
+    # Matches the first real replacement field ({name}, not the literal {{)
+    _FIRST_FIELD_RE = re.compile(r'(?<!\{)\{(?!\{)')
+
+    def _split_static_prefix(self, prompt: Prompt) -> Tuple[str, str]:
+        """
+        Split a user template into (static prefix, variable suffix).
+
+        The prefix is everything before the first replacement field; with
+        the templates keeping variables at the tail, this is the bulk of
+        the prompt and is byte-stable across events, which is what
+        provider-side prefix caching keys on. Split points are cached per
+        prompt name.
+        """
+        cached = self._prefix_splits.get(prompt.name)
+        if cached is not None:
+            return cached
+        template = prompt.user_prompt_template
+        match = self._FIRST_FIELD_RE.search(template)
+        if match:
+            prefix, suffix = template[:match.start()], template[match.start():]
+        else:
+            prefix, suffix = template, ""
+        # The prefix holds no fields, so formatting it here just collapses
+        # {{ }} escapes once instead of on every call
+        split = (prefix.format(), suffix)
+        self._prefix_splits[prompt.name] = split
+        return split
+
+    def format_prompt_blocks(self, prompt: Prompt, **kwargs) -> Tuple[str, list]:
+        """
+        Format a prompt as provider cache-friendly content blocks.
+
+        Returns (system_prompt, blocks) where the stable template prefix
+        carries an Anthropic-style cache_control marker; providers with
+        automatic prefix detection (OpenAI, Gemini) benefit simply from
+        the prefix being emitted byte-for-byte each call.
+        """
+        prefix, suffix_template = self._split_static_prefix(prompt)
+        blocks = []
+        if prefix:
+            blocks.append({
+                "type": "text",
+                "text": prefix,
+                "cache_control": {"type": "ephemeral"},
+            })
+        if suffix_template:
+            # Only the suffix pays str.format cost; the prefix is reused
+            blocks.append({
+                "type": "text",
+                "text": _format_cached(
+                    suffix_template, tuple(sorted(kwargs.items()))
+                ),
+            })
+        return prompt.system_prompt, blocks
+
     def format_prompt(self, prompt: Prompt, **kwargs) -> Tuple[str, str]:
         """
         Format a prompt template with provided values.
@@ -107,10 +247,15 @@ class PromptManager:
         Returns:
             Tuple of (system_prompt, user_prompt)
         """
-        user_prompt = prompt.user_prompt_template.format(**kwargs)
+        user_prompt = _format_cached(
+            prompt.user_prompt_template, tuple(sorted(kwargs.items()))
+        )
         return prompt.system_prompt, user_prompt
     
     def list_prompts(self) -> Dict[str, Prompt]:
         """List all available prompts."""
+        # Listing needs everything, so parse whatever is still pending
+        for yaml_file in list(self._pending.values()):
+            self._load_file(yaml_file)
         return self.prompts.copy()
 
@@ -1,5 +1,7 @@
 """SMS summary generation for events."""
 
+import hashlib
+from collections import OrderedDict
 from typing import Dict, Any, Optional
 
 from ..models.event import StructuredEvent
@@ -19,6 +21,10 @@ class SMSGenerator:
         """
         self.llm_service = llm_service
         self.prompt_manager = llm_service.prompt_manager
+        # Byte-identical prompts (duplicate events, retries) reuse the
+        # generated text instead of another LLM call
+        self._exact_cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self._exact_cache_size = 4096
     
     async def generate_sms(self, event: StructuredEvent, max_length: int = 160) -> str:
         """
@@ -53,7 +59,21 @@ class SMSGenerator:
         
         # TODO: Call LLM to generate SMS
         # For now, return fallback
-        sms_text = await self._call_llm_for_sms(system_prompt, user_prompt, max_length)
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(self.llm_service.model.encode())
+        hasher.update(system_prompt.encode())
+        hasher.update(user_prompt.encode())
+        hasher.update(str(max_length).encode())
+        exact_key = hasher.digest()
+
+        sms_text = self._exact_cache.get(exact_key)
+        if sms_text is not None:
+            self._exact_cache.move_to_end(exact_key)
+        else:
+            sms_text = await self._call_llm_for_sms(system_prompt, user_prompt, max_length)
+            self._exact_cache[exact_key] = sms_text
+            while len(self._exact_cache) > self._exact_cache_size:
+                self._exact_cache.popitem(last=False)
         
         # Ensure it's within max_length
         if len(sms_text) > max_length:
@@ -68,7 +88,9 @@ class SMSGenerator:
         max_length: int
     ) -> str:
         """Call LLM to generate SMS summary."""
-        # TODO: Implement actual LLM call
+        # TODO: Implement actual LLM call over
+        # self.llm_service.http_client() so SMS generation shares the
+        # pooled connections instead of opening its own
         # For now, return placeholder
         return "Wydarzenie: [placeholder - implement LLM call]"
     
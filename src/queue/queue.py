@@ -1,5 +1,6 @@
 """Event queue interface and implementation."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import AsyncIterator, Optional
 
@@ -18,7 +19,18 @@ class EventQueue(ABC):
     async def consume(self) -> AsyncIterator[RawEvent]:
         """Consume events from queue."""
         pass
-    
+
+    @abstractmethod
+    async def get(self) -> RawEvent:
+        """
+        Await and return a single event.
+
+        Hot-path alternative to consume(): one await per event instead of
+        a round-trip through the async-generator machinery per yield.
+        """
+        pass
+
+
     @abstractmethod
     async def ack(self, event_id: str) -> bool:
         """Acknowledge event processing."""
@@ -32,28 +44,39 @@ class EventQueue(ABC):
 
 class InMemoryEventQueue(EventQueue):
     """In-memory event queue (for development/testing)."""
-    
-    def __init__(self):
-        """Initialize in-memory queue."""
-        self.queue = []
+
+    def __init__(self, maxsize: int = 0):
+        """
+        Initialize in-memory queue.
+
+        Args:
+            maxsize: Bound on queued events; publish blocks when full so
+                ingestion back-pressures instead of buffering unboundedly
+                (0 means unbounded).
+        """
+        # asyncio.Queue wakes waiting consumers via condition variables,
+        # so consume blocks for the next event instead of polling
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
         self.processing = {}
-    
+
     async def publish(self, event: RawEvent) -> bool:
         """Publish event to queue."""
-        self.queue.append(event)
+        await self.queue.put(event)
         return True
-    
+
     async def consume(self) -> AsyncIterator[RawEvent]:
         """Consume events from queue."""
         while True:
-            if self.queue:
-                event = self.queue.pop(0)
-                self.processing[event.event_id] = event
-                yield event
-            else:
-                # TODO: Implement proper async waiting
-                break
-    
+            yield await self.get()
+
+    async def get(self) -> RawEvent:
+        """Await and return a single event."""
+        event = await self.queue.get()
+        self.processing[event.event_id] = event
+        self.queue.task_done()
+        return event
+
+
     async def ack(self, event_id: str) -> bool:
         """Acknowledge event processing."""
         if event_id in self.processing:
@@ -65,6 +88,6 @@ class InMemoryEventQueue(EventQueue):
         if event_id in self.processing:
             event = self.processing.pop(event_id)
             if requeue:
-                self.queue.append(event)
+                await self.queue.put(event)
         return True
 
@@ -1,9 +1,15 @@
 """Pytest configuration and fixtures."""
 
 import os
+from pathlib import Path
+
 import pytest
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
-
+# Load environment variables from the project .env, if one exists.
+# The explicit path skips find_dotenv()'s upward directory walk, and the
+# existence check skips the call entirely on every collection pass and
+# xdist worker when there is nothing to load.
+_env_file = Path(__file__).parent.parent / ".env"
+if _env_file.is_file():
+    load_dotenv(_env_file, override=False)
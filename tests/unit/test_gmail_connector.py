@@ -0,0 +1,14 @@
+"""Unit tests for Gmail connector."""
+
+import pytest
+
+from src.ingestion.adapters import GmailConnector
+
+
+@pytest.mark.unit
+def test_set_query():
+    """Test updating the query."""
+    # Pure in-memory state change; no connect() and no credentials needed
+    connector = GmailConnector("test_gmail_source", {"query": "is:unread"})
+    connector.set_query("is:unread subject:test")
+    assert connector.query == "is:unread subject:test"